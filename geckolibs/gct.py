@@ -2,7 +2,8 @@ import sys
 from enum import Enum
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import BinaryIO, Dict, Iterable, TextIO, Union
+from typing import (BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO,
+                    Tuple, Union)
 
 from dolreader.dol import DolFile
 
@@ -45,12 +46,16 @@ class GeckoCodeTable(object):
     gameName: str
 
     Magic = b"\x00\xD0\xC0\xDE\x00\xD0\xC0\xDE"
+    MagicText = "00D0C0DE 00D0C0DE"
+    ExitBytes = b"\xF0\x00\x00\x00\x00\x00\x00\x00"
+    ExitText = "F0000000 00000000"
     VolatileToken = "[[volatile]]"
 
     def __init__(self, gameID: str = "GECK01", gameName: str = "geckocode-libs"):
         self.gameID = gameID
         self.gameName = gameName
-        self._codes: Dict[str, GeckoCode] = {}
+        self._codes: List[GeckoCode] = []
+        self._index: Dict[str, int] = {}
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.__dict__})"
@@ -59,75 +64,79 @@ class GeckoCodeTable(object):
         return f"GeckoCodeTable containing {self.virtual_length()} codes, at 0x{len(self):X} bytes long"
 
     def __len__(self) -> int:
-        return sum([len(c) for c in self]) + 16
+        return sum(len(c) for c in self._codes) + 16
 
-    def __iter__(self):
-        self._iterpos = 0
-        return self
-
-    def __next__(self) -> GeckoCode:
-        try:
-            self._iterpos += 1
-            return list(self._codes.values())[self._iterpos-1]
-        except IndexError:
-            raise StopIteration
+    def __iter__(self) -> Iterator[GeckoCode]:
+        return iter(self._codes)
 
     def __getitem__(self, key: Union[str, int]) -> GeckoCode:
         if isinstance(key, str):
-            return self._codes[key]
+            return self._codes[self._index[key]]
         else:
-            return list(self._codes.values())[key]
+            return self._codes[key]
 
     def __setitem__(self, key: str, value: GeckoCode):
         if not isinstance(value, GeckoCode):
             raise InvalidGeckoCodeError(
                 f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
 
-        self._codes[key] = value
+        self._set_code(key, value)
 
-    def __hash__(self) -> str:
-        return sum([hash(c) for c in self])
+    def __hash__(self) -> int:
+        return hash(self.as_bytes())
 
     def __eq__(self, other: "GeckoCodeTable") -> bool:
-        return hash(self) == hash(other)
+        if not isinstance(other, GeckoCodeTable):
+            return NotImplemented
+        return self._codes == other._codes
 
     def __ne__(self, other: "GeckoCodeTable") -> bool:
-        return hash(self) != hash(other)
+        return not self == other
 
-    def __iadd__(self, other: Union["GeckoCodeTable", GeckoCommand]):
+    def __iadd__(self, other: Union["GeckoCodeTable", GeckoCode]) -> "GeckoCodeTable":
         if isinstance(other, GeckoCodeTable):
-            for code in other:
-                self.add_child(code)
-        elif isinstance(other, GeckoCommand):
+            for code in other._codes:
+                self._set_code(code.name, code)
+        elif isinstance(other, GeckoCode):
             self.add_child(other)
         else:
             raise TypeError(
                 f"{other.__class__.__name__} cannot be added to a {self.__class__.__name__}")
+        return self
 
     @staticmethod
-    def detect_codelist_type(f: Union[Path, TextIO, str]) -> GeckoTextType:
+    def detect_codelist_type(f: Union[Path, TextIO, str, Iterable[str]]) -> GeckoTextType:
         """Return the type of codelist that was detected"""
         if isinstance(f, str):
             f = StringIO(f)
         elif isinstance(f, Path):
             f = StringIO(f.read_text())
 
-        for line in f.readlines():
+        return GeckoCodeTable._scan_codelist_type(f)[0]
+
+    @staticmethod
+    def _scan_codelist_type(lines: Iterable[str]) -> Tuple[Optional[GeckoTextType], int]:
+        """Return the detected codelist type and the index of the line it was detected from"""
+        i = -1
+        for i, line in enumerate(lines):
             line = line.strip()
             if line == "":
                 continue
             elif line == "[Gecko]":
-                return GeckoTextType.DOLPHIN
+                return GeckoTextType.DOLPHIN, i
             elif len(line) == 6:
-                return GeckoTextType.OCARINA
+                return GeckoTextType.OCARINA, i
             else:
-                return GeckoTextType.RAW
+                return GeckoTextType.RAW, i
+        return None, i + 1
 
     @classmethod
-    def from_bytes(cls, f: Union[BinaryIO, bytes]) -> "GeckoCodeTable":
+    def from_bytes(cls, f: Union[BinaryIO, bytes, bytearray, memoryview]) -> "GeckoCodeTable":
         """Create a new `GeckoCodeTable` from raw bytes"""
-        if isinstance(f, bytes):
+        if isinstance(f, (bytes, bytearray, memoryview)):
             f = BytesIO(f)
+        elif not isinstance(f, BytesIO):
+            f = BytesIO(f.read())
 
         magic = f.read(8)
         assert magic == GeckoCodeTable.Magic, f"GeckoCodeTable magic not found (0x{magic.hex()} != 0x{GeckoCodeTable.Magic.hex()})"
@@ -149,51 +158,56 @@ class GeckoCodeTable(object):
                 return False
 
             try:
-                int(text[:8] + text[9:], 16)
+                bytes.fromhex(text)
                 return True
             except ValueError:
                 return False
 
-        if not isinstance(f, StringIO):
-            if isinstance(f, str):
-                f = StringIO(f)
-            else:
-                f = StringIO(f.read())
+        if isinstance(f, StringIO):
+            lines = f.getvalue().splitlines()
+        elif isinstance(f, str):
+            lines = f.splitlines()
+        else:
+            lines = f.read().splitlines()
 
+        length = len(lines)
         gct = cls()
         enabledCodes = set()
         _foundEnabled = False
 
-        mode = GeckoCodeTable.detect_codelist_type(f)
+        mode, start = GeckoCodeTable._scan_codelist_type(lines)
         if mode == GeckoTextType.DOLPHIN:
-            f.seek(0)
-            while f.tell() < len(f.getvalue()):
-                line = f.readline().strip()
+            i = start + 1
+            while i < length:
+                line = lines[i].strip()
+                i += 1
                 if line == "[Gecko_Enabled]":
                     _foundEnabled = True
-                    line = f.readline().strip()
-                    while line.startswith("$"):
+                    while i < length:
+                        line = lines[i].strip()
+                        if not line.startswith("$"):
+                            break
                         enabledCodes.add(line[1:].strip())
-                        line = f.readline().strip()
+                        i += 1
                     break
 
-        f.seek(0)
-
         name = ""
         author = ""
         desc = []
         data = []
+        packet = bytearray()
         _gameInfoCollected = False
-        while f.tell() < len(f.getvalue()):
-            line = f.readline()
+        i = start
+        while i < length:
+            line = lines[i]
             sLine = line.strip()
+            i += 1
             if mode == GeckoTextType.DOLPHIN:
-                if line == "":
-                    continue
-                elif line.startswith("$"):
-                    if len(data) > 0:
-                        code = GeckoCode.from_text(
-                            "\n".join(data).strip(),
+                head = line[:1]
+                if head == "$":
+                    if len(packet) > 0:
+                        code = GeckoCode.from_bytes(
+                            bytes(packet),
                             name.strip(),
                             author,
                             "\n".join(desc),
@@ -202,7 +216,7 @@ class GeckoCodeTable(object):
                             preapplicable=isPreApplicable
                         )
                         gct.add_child(code)
-                        data.clear()
+                        packet.clear()
                         desc.clear()
 
                     isPreApplicable = True
@@ -210,18 +224,20 @@ class GeckoCodeTable(object):
                         isPreApplicable = False
                         sLine = sLine[:-len(GeckoCodeTable.VolatileToken)].strip()
 
-                    n = sLine[::-1].find("[") + 1
-                    if n == 0:
+                    n = sLine.rfind("[")
+                    if n == -1:
                         name = sLine[1:]
                         author = None
                     else:
-                        name = sLine[1:-n].strip()
-                        author = sLine[-n+1:-1].strip()
-                elif line.startswith("*"):
-                    desc.append(line[1:-1])
-                else:
-                    if "".join(sLine.split()).isalnum():
-                        data.append(sLine)
+                        name = sLine[1:n].strip()
+                        author = sLine[n+1:-1].strip()
+                elif head == "*":
+                    desc.append(line[1:])
+                elif sLine != "":
+                    try:
+                        packet.extend(bytes.fromhex(sLine))
+                    except ValueError:
+                        continue
             elif mode == GeckoTextType.OCARINA:
                 if sLine == "":
                     name = ""
@@ -230,8 +246,12 @@ class GeckoCodeTable(object):
                     data.clear()
                     continue
                 elif not _gameInfoCollected:
-                    gct.gameID = line.strip()
-                    gct.gameName = f.readline().strip()
+                    gct.gameID = sLine
+                    if i < length:
+                        gct.gameName = lines[i].strip()
+                        i += 1
+                    else:
+                        gct.gameName = ""
                     _gameInfoCollected = True
                     continue
 
@@ -240,19 +260,20 @@ class GeckoCodeTable(object):
                     isPreApplicable = False
                     sLine = sLine[:-len(GeckoCodeTable.VolatileToken)].strip()
 
-                n = sLine[::-1].find("[") + 1
-                if n == 0:
+                n = sLine.rfind("[")
+                if n == -1:
                     name = sLine
                     author = None
                 else:
-                    name = sLine[:-n].strip()
-                    author = sLine[-n+1:-1].strip()
+                    name = sLine[:n].strip()
+                    author = sLine[n+1:-1].strip()
 
                 _firstPass = True
                 _enabled = False
                 _descReading = False
-                while f.tell() < len(f.getvalue()):
-                    sLine = f.readline().strip()
+                while i < length:
+                    sLine = lines[i].strip()
+                    i += 1
                     nsLine = sLine.lstrip("*").strip()
                     if _firstPass:
                         _enabled = sLine.startswith("*")
@@ -287,7 +308,7 @@ class GeckoCodeTable(object):
                 else:
                     data.clear()
 
-                if f.tell() >= len(f.getvalue()):
+                if i >= length:
                     if len(data) > 0:
                         gct.add_child(GeckoCode.from_text(
                             "\n".join(data).strip()))
@@ -296,40 +317,54 @@ class GeckoCodeTable(object):
         return gct
 
     @property
-    def children(self) -> Iterable[GeckoCommand]:
-        for code in self._codes.values():
+    def children(self) -> Iterable[Union[GeckoCode, GeckoCommand]]:
+        for code in self._codes:
             yield code
             yield from code.children
 
     def add_child(self, code: GeckoCode):
         """Adds the given `GeckoCode` to the list"""
-        self._codes[code.name] = code
+        self._set_code(code.name, code)
 
     def remove_child(self, code: Union[GeckoCode, str]):
         """Removes the given `GeckoCode` from the list"""
         if isinstance(code, GeckoCode):
-            self._codes.pop(code.name)
-        else:
-            self._codes.pop(code)
+            code = code.name
+
+        index = self._index.pop(code)
+        self._codes.pop(index)
+        for name, i in self._index.items():
+            if i > index:
+                self._index[name] = i - 1
 
-    def get_child(self, name: str) -> GeckoCode:
+    def get_child(self, name: str) -> Optional[GeckoCode]:
         """Returns the `GeckoCode` with the given name, or `None` if not found"""
         try:
-            return self._codes[name]
+            return self._codes[self._index[name]]
         except KeyError:
             return None
 
     def virtual_length(self) -> int:
         """Returns the length of this GCT in Gecko \"lines\""""
-        return sum([c.virtual_length() for c in self])
+        return sum(c.virtual_length() for c in self._codes)
+
+    def _set_code(self, name: str, code: GeckoCode):
+        """Store `code` under `name`, replacing in place any code already stored by that name"""
+        name = sys.intern(name)
+        if name in self._index:
+            self._codes[self._index[name]] = code
+        else:
+            self._index[name] = len(self._codes)
+            self._codes.append(code)
 
     def apply(self, dol: DolFile) -> bool:
         """Apply this GCT directly to a DOL if supported as provided by a `DolFile`
 
-           Return True if the command is successfully applied"""
+           Return True if any code is successfully applied"""
         status = False
-        for code in self:
-            status |= code.apply(dol)
+        for code in self._codes:
+            if code.apply(dol):
+                status = True
         return status
 
     def apply_f(self, dolpath: str) -> bool:
@@ -350,24 +385,23 @@ class GeckoCodeTable(object):
 
     def as_bytes(self) -> bytes:
         """Return the raw data representation of this GCT"""
-        packet = b""
-        for code in self:
-            packet += code.as_bytes()
-        return GeckoCodeTable.Magic + packet + b"\xF0\x00\x00\x00\x00\x00\x00\x00"
+        packet = [GeckoCodeTable.Magic]
+        packet.extend(code.as_bytes() for code in self)
+        packet.append(GeckoCodeTable.ExitBytes)
+        return b"".join(packet)
 
     def as_text(self) -> str:
         """Return the textual representation of this GCT"""
-        magic = "00D0C0DE 00D0C0DE\n"
-        packet = ""
-        for code in self:
-            packet += f"{code.as_text()}\n"
-        return (magic + packet + "F0000000 00000000").strip()
+        packet = [GeckoCodeTable.MagicText]
+        packet.extend(code.as_text() for code in self)
+        packet.append(GeckoCodeTable.ExitText)
+        return "\n".join(packet).strip()
 
     def as_codelist(self, ty: GeckoTextType = GeckoTextType.DOLPHIN) -> str:
         """Return this GCT as a textual codelist of the type specified by `ty`"""
         if ty == GeckoTextType.DOLPHIN:
-            codelist = "[Gecko]\n"
-            enableds = "[Gecko_Enabled]\n"
+            codelist = ["[Gecko]\n"]
+            enableds = ["[Gecko_Enabled]\n"]
             for code in self:
                 author = ""
                 desc = "*\n"
@@ -375,15 +409,15 @@ class GeckoCodeTable(object):
                 if code.author:
                     author = f" [{code.author}]"
                 if code.desc:
-                    desc = "*" + "\n*".join(code.desc.split("\n")) + "\n"
+                    desc = "*" + code.desc.replace("\n", "\n*") + "\n"
                 if not code.is_preapplicable():
                     token = " " + GeckoCodeTable.VolatileToken
-                codelist += f"${code.name}{author}{token}\n{code.as_text()}\n{desc}"
+                codelist.append(f"${code.name}{author}{token}\n{code.as_text()}\n{desc}")
                 if code.is_enabled():
-                    enableds += f"${code.name}\n"
-            return f"{codelist}{enableds.rstrip()}"
+                    enableds.append(f"${code.name}\n")
+            return "".join(codelist) + "".join(enableds).rstrip()
         elif ty == GeckoTextType.OCARINA:
-            codelist = f"{self.gameID.strip()}\n{self.gameName.strip()}\n\n"
+            codelist = [f"{self.gameID.strip()}\n{self.gameName.strip()}\n\n"]
             for code in self:
                 author = ""
                 desc = ""
@@ -395,22 +429,26 @@ class GeckoCodeTable(object):
                 if not code.is_preapplicable():
                     token = " " + GeckoCodeTable.VolatileToken
                 prefix = "\n* " if code.is_enabled() else "\n"
-                data = prefix.join(code.as_text().split("\n"))
-                codelist += f"{code.name}{author}{token}{prefix}{data}\n{desc}\n"
-            return codelist.rstrip()
+                data = code.as_text().replace("\n", prefix)
+                codelist.append(f"{code.name}{author}{token}{prefix}{data}\n{desc}\n")
+            return "".join(codelist).rstrip()
         else:
-            codelist = ""
-            for code in self:
-                codelist += f"{code.as_text()}\n\n"
+            codelist = "\n\n".join(code.as_text() for code in self)
             return codelist.rstrip()
 
     def print_map(self, buffer: TextIO = sys.stdout, indent: int = 2, startindent: int = 0):
         """Print a human readable indented map of this GCT"""
-        _prev = GeckoCommand._IndentionWidth
-        GeckoCommand._IndentionWidth = indent
-        GeckoCommand._IndentionStart = startindent
+        lines = []
         for code in self:
-            for command in code:
-                print(command, file=buffer)
-        GeckoCommand._IndentionWidth = _prev
-        print(str(Exit()), file=buffer)
+            stack = [(command, 0) for command in reversed(list(code))]
+            while stack:
+                command, depth = stack.pop()
+                padding = " "*(startindent + (indent*depth)) if depth > 0 else ""
+                if GeckoCommand.is_ifblock(command):
+                    lines.append(padding + command._header_str())
+                    stack.extend((child, depth + 1)
+                                 for child in reversed(command.children))
+                else:
+                    lines.append(padding + str(command))
+        lines.append(str(Exit()))
+        print("\n".join(lines), file=buffer)
@@ -1,21 +1,32 @@
 from enum import IntEnum
 from io import BufferedIOBase, BytesIO, StringIO
-from typing import (Any, BinaryIO, Callable, Iterable, List, Optional, TextIO, Tuple,
+from itertools import islice
+from struct import Struct, error as StructError
+from typing import (Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple,
                     Union)
 
 from dolreader.dol import DolFile
 
 from geckolibs import __version__
 
+_CommandHeader = Struct(">II")
+
 
 def _align_bytes(_bytes: bytes, alignment: int = 4, fill: bytes = b"\x00") -> bytes:
-    length = len(_bytes)
-    diff = alignment - (length % alignment)
-    if diff == alignment:
+    assert alignment & (alignment - 1) == 0, f"Alignment must be a power of 2 ({alignment})"
+    diff = -len(_bytes) & (alignment - 1)
+    if diff == 0:
         return _bytes
     return _bytes + (fill * diff)
 
 
+def _pack_header(metadata: int, info: int) -> bytes:
+    try:
+        return _CommandHeader.pack(metadata, info)
+    except StructError as e:
+        raise OverflowError(str(e)) from None
+
+
 def _get_io_length(f: BufferedIOBase):
     _oldPos = f.tell()
     f.seek(0, 2)
@@ -24,6 +35,35 @@ def _get_io_length(f: BufferedIOBase):
     return length
 
 
+class _StreamBuffer:
+    """Buffer view of a binary stream from its current position, read only as far as it is indexed"""
+
+    def __init__(self, f: BinaryIO):
+        self.stream = f
+        self.start = f.tell()
+        self._length = _get_io_length(f) - self.start
+        self._data = bytearray()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, bytes]:
+        if isinstance(key, slice):
+            self._fill(key.indices(self._length)[1])
+            return bytes(self._data[key])
+
+        if key < 0:
+            key += self._length
+        self._fill(key + 1)
+        return self._data[key]
+
+    def _fill(self, end: int):
+        end = min(end, self._length)
+        if end > len(self._data):
+            self.stream.seek(self.start + len(self._data))
+            self._data += self.stream.read(end - len(self._data))
+
+
 class InvalidGeckoCommandError(Exception):
     ...
 
@@ -32,11 +72,6 @@ class InvalidGeckoCodeError(Exception):
     ...
 
 
-class classproperty(property):
-    def __get__(self, cls, owner):
-        return classmethod(self.fget).__get__(None, owner)()
-
-
 class GeckoCommand():
     """
     Representation of a single command following the Gecko format.
@@ -142,16 +177,16 @@ class GeckoCommand():
         FADDS = 9
         FMULS = 10
 
+    codetype: Optional[Type] = None
+    __slots__ = ("_iterpos",)
+
     @staticmethod
     def int_to_type(id: int) -> Type:
         """Returns the `Type` the integer `id` represents"""
-        id &= 0xFE
-        if id == 0xF4:
-            return GeckoCommand.Type.ASM_INSERT_XOR
-        elif id >= 0xF0:
-            return GeckoCommand.Type(id & 0xFE)
-        else:
-            return GeckoCommand.Type(id & 0xEE)
+        codetype = _TypeFromOpcode[id & 0xFE]
+        if codetype is None:
+            raise ValueError(f"0x{id & 0xFE:02X} is not a valid GeckoCommand.Type")
+        return codetype
 
     @staticmethod
     def type_to_int(ty: Type) -> int:
@@ -164,25 +199,7 @@ class GeckoCommand():
         if isinstance(_type, GeckoCommand):
             _type = _type.codetype
 
-        return _type in {
-            GeckoCommand.Type.IF_EQ_32,
-            GeckoCommand.Type.IF_NEQ_32,
-            GeckoCommand.Type.IF_GT_32,
-            GeckoCommand.Type.IF_LT_32,
-            GeckoCommand.Type.IF_EQ_16,
-            GeckoCommand.Type.IF_NEQ_16,
-            GeckoCommand.Type.IF_GT_16,
-            GeckoCommand.Type.IF_LT_16,
-            GeckoCommand.Type.GECKO_IF_EQ_16,
-            GeckoCommand.Type.GECKO_IF_NEQ_16,
-            GeckoCommand.Type.GECKO_IF_GT_16,
-            GeckoCommand.Type.GECKO_IF_LT_16,
-            GeckoCommand.Type.COUNTER_IF_EQ_16,
-            GeckoCommand.Type.COUNTER_IF_NEQ_16,
-            GeckoCommand.Type.COUNTER_IF_GT_16,
-            GeckoCommand.Type.COUNTER_IF_LT_16,
-            GeckoCommand.Type.BRAINSLUG_SEARCH
-        }
+        return _type in _IfBlockTypes
 
     @staticmethod
     def is_multiline(_type: Union[Type, "GeckoCommand"]) -> bool:
@@ -190,14 +207,7 @@ class GeckoCommand():
         if isinstance(_type, GeckoCommand):
             _type = _type.codetype
 
-        return _type in {
-            GeckoCommand.Type.WRITE_STR,
-            GeckoCommand.Type.WRITE_SERIAL,
-            GeckoCommand.Type.ASM_EXECUTE,
-            GeckoCommand.Type.ASM_INSERT,
-            GeckoCommand.Type.ASM_INSERT_XOR,
-            GeckoCommand.Type.BRAINSLUG_SEARCH
-        }
+        return _type in _MultilineTypes
 
     @staticmethod
     def can_preprocess(_type: Union[Type, "GeckoCommand"]) -> bool:
@@ -205,14 +215,7 @@ class GeckoCommand():
         if isinstance(_type, GeckoCommand):
             _type = _type.codetype
 
-        return _type in {
-            GeckoCommand.Type.WRITE_8,
-            GeckoCommand.Type.WRITE_16,
-            GeckoCommand.Type.WRITE_32,
-            GeckoCommand.Type.WRITE_STR,
-            GeckoCommand.Type.WRITE_SERIAL,
-            GeckoCommand.Type.WRITE_BRANCH
-        }
+        return _type in _PreprocessTypes
 
     @staticmethod
     def assert_register(gr: int):
@@ -247,785 +250,55 @@ class GeckoCommand():
 
     @staticmethod
     def bytes_to_geckocommand(f: Union[BinaryIO, bytes]) -> "GeckoCommand":
-        """Converts an array of bytes to a `GeckoCommand` and returns the result"""
-
-        def add_children_till_terminator(code: "GeckoCommand", f: BytesIO):
-            while f.tell() < _get_io_length(f):
-                child = GeckoCommand.bytes_to_geckocommand(f)
-                if child is None:
-                    raise InvalidGeckoCommandError("Data passed to bytes parser did not resolve to a command!")
-                if child.codetype in {GeckoCommand.Type.TERMINATOR, GeckoCommand.Type.EXIT}:
-                    f.seek(-8, 1)
-                    return
-                code.add_child(child)
-
-        if not isinstance(f, BufferedIOBase):
-            f = BytesIO(f)
-
-        metadata = f.read(4)
-        address = int.from_bytes(
-            metadata, byteorder="big", signed=False) & 0x1FFFFFF
-        try:
-            codetype = GeckoCommand.int_to_type((int.from_bytes(
-                metadata, "big", signed=False) >> 24) & 0xFE)
-        except ValueError:
-            f.seek(-4, 1)
-            return GeckoCommand._BadCommandBytesCB(f)
-        isPointerType = ((int.from_bytes(
-            metadata, "big", signed=False) >> 24) & 0x10 != 0)
-
-        if codetype == GeckoCommand.Type.WRITE_8:
-            info = f.read(4)
-            value = int.from_bytes(info[3:], "big", signed=False)
-            repeat = int.from_bytes(info[:2], "big", signed=False)
-            return Write8(value, address, repeat, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_16:
-            info = f.read(4)
-            value = int.from_bytes(info[2:], "big", signed=False)
-            repeat = int.from_bytes(info[:2], "big", signed=False)
-            return Write16(value, address, repeat, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_32:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            return Write32(value, address, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_STR:
-            size = int.from_bytes(f.read(4), "big", signed=False)
-            code = WriteString(f.read(size), address, isPointerType)
-            f.seek(((size + 7) & -8) - size, 1)
-            return code
-        elif codetype == GeckoCommand.Type.WRITE_SERIAL:
-            info = f.read(12)
-            value = int.from_bytes(info[:4], "big", signed=False)
-            valueSize = int.from_bytes(info[4:5], "big", signed=False) >> 4
-            repeat = int.from_bytes(info[4:6], "big", signed=False) & 0xFFF
-            addressInc = int.from_bytes(info[6:8], "big", signed=False)
-            valueInc = int.from_bytes(info[8:], "big", signed=False)
-            return WriteSerial(value, address, repeat, isPointerType, valueSize, addressInc, valueInc)
-        elif codetype == GeckoCommand.Type.IF_EQ_32:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfEqual32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_NEQ_32:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfNotEqual32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_GT_32:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfGreaterThan32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_LT_32:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfLesserThan32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_EQ_16:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfEqual16(value, address, endif=(
-                address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_NEQ_16:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfNotEqual16(value, address, endif=(
-                address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_GT_16:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfGreaterThan16(
-                value, address, endif=(address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_LT_16:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfLesserThan16(
-                value, address, endif=(address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.BASE_ADDR_LOAD:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressLoad(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.BASE_ADDR_SET:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressSet(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.BASE_ADDR_STORE:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressStore(value, flags & 0x00110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.BASE_GET_NEXT:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressGetNext(value)
-        elif codetype == GeckoCommand.Type.PTR_ADDR_LOAD:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressLoad(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.PTR_ADDR_SET:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressSet(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.PTR_ADDR_STORE:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressStore(value, flags & 0x00110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.PTR_GET_NEXT:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressGetNext(value)
-        elif codetype == GeckoCommand.Type.REPEAT_SET:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            repeat = int.from_bytes(metadata, "big", signed=False) & 0xFFFF
-            return SetRepeat(repeat, value)
-        elif codetype == GeckoCommand.Type.REPEAT_EXEC:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            return ExecuteRepeat(value)
-        elif codetype == GeckoCommand.Type.RETURN:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00300000) >> 20
-            return Return(value)
-        elif codetype == GeckoCommand.Type.GOTO:
-            info = f.read(4)
-            value = int.from_bytes(metadata, "big", signed=False) & 0xFFFF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00300000) >> 20
-            return Goto(flags, value)
-        elif codetype == GeckoCommand.Type.GOSUB:
-            info = f.read(4)
-            value = int.from_bytes(metadata, "big", signed=False) & 0xFFFF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00300000) >> 20
-            register = int.from_bytes(info, "big", signed=False) & 0xF
-            return Gosub(flags, value, register)
-        elif codetype == GeckoCommand.Type.GECKO_REG_SET:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00110000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return GeckoRegisterSet(value, flags, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_REG_LOAD:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00310000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return GeckoRegisterLoad(value, flags, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_REG_STORE:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00310000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            repeat = (int.from_bytes(metadata, "big",
-                                     signed=False) & 0xFFF0) >> 4
-            return GeckoRegisterStore(value, repeat, flags, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_REG_OPERATE_I:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00030000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            opType = GeckoCommand.ArithmeticType(
-                (int.from_bytes(metadata, "big", signed=False) & 0x00F00000) >> 18)
-            return GeckoRegisterOperateI(value, opType, flags, register)
-        elif codetype == GeckoCommand.Type.GECKO_REG_OPERATE:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00030000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            opType = GeckoCommand.ArithmeticType(
-                (int.from_bytes(metadata, "big", signed=False) & 0x00F00000) >> 18)
-            return GeckoRegisterOperate(value, opType, flags, register)
-        elif codetype == GeckoCommand.Type.MEMCPY_1:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            size = (int.from_bytes(metadata, "big",
-                                   signed=False) & 0x00FFFF00) >> 8
-            register = (int.from_bytes(
-                metadata, "big", signed=False) & 0xF0) >> 4
-            otherRegister = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return MemoryCopyTo(value, size, otherRegister, register, isPointerType)
-        elif codetype == GeckoCommand.Type.MEMCPY_2:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            size = (int.from_bytes(metadata, "big",
-                                   signed=False) & 0x00FFFF00) >> 8
-            register = (int.from_bytes(
-                metadata, "big", signed=False) & 0xF0) >> 4
-            otherRegister = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return MemoryCopyFrom(value, size, otherRegister, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_IF_EQ_16:
-            info = f.read(4)
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfEqual16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.GECKO_IF_NEQ_16:
-            info = f.read(4)
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfNotEqual16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.GECKO_IF_GT_16:
-            info = f.read(4)
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfGreaterThan16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.GECKO_IF_LT_16:
-            info = f.read(4)
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfLesserThan16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_EQ_16:
-            info = f.read(4)
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfEqual16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_NEQ_16:
-            info = f.read(4)
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfNotEqual16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_GT_16:
-            info = f.read(4)
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfGreaterThan16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_LT_16:
-            info = f.read(4)
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfLesserThan16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.ASM_EXECUTE:
-            info = f.read(4)
-            size = int.from_bytes(info, "big", signed=False)
-            return AsmExecute(f.read(size << 3))
-        elif codetype == GeckoCommand.Type.ASM_INSERT:
-            info = f.read(4)
-            size = int.from_bytes(info, "big", signed=False)
-            return AsmInsert(f.read(size << 3), address, isPointerType, isLink=(address & 1) != 0)
-        elif codetype == GeckoCommand.Type.ASM_INSERT_LINK:
-            info = f.read(4)
-            size = int.from_bytes(info, "big", signed=False)
-            return AsmInsert(f.read(size << 3), address, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_BRANCH:
-            info = f.read(4)
-            dest = int.from_bytes(info, "big", signed=False)
-            return WriteBranch(dest, address, isPointerType, isLink=(address & 1) != 0)
-        elif codetype == GeckoCommand.Type.SWITCH:
-            return Switch()
-        elif codetype == GeckoCommand.Type.ADDR_RANGE_CHECK:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            endif = int.from_bytes(metadata, "big", signed=False) & 0x1
-            return AddressRangeCheck(value, isPointerType, endif)
-        elif codetype == GeckoCommand.Type.TERMINATOR:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            return Terminator(value)
-        elif codetype == GeckoCommand.Type.ENDIF:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            inverse = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0x00F00000) >> 24
-            numEndifs = int.from_bytes(metadata, "big", signed=False) & 0xFF
-            return Endif(value, inverse, numEndifs)
-        elif codetype == GeckoCommand.Type.EXIT:
-            f.seek(4, 1)
-            return Exit()
-        elif codetype == GeckoCommand.Type.ASM_INSERT_XOR:
-            info = f.read(4)
-            size = int.from_bytes(info, "big", signed=False) & 0x000000FF
-            xor = int.from_bytes(info, "big", signed=False) & 0x00FFFF00
-            num = int.from_bytes(info, "big", signed=False) & 0xFF000000
-            pointer = codetype.value == 0xF4
-            return AsmInsertXOR(f.read(size << 3), address, pointer, xor, num, isLink=(address & 1) != 0)
-        elif codetype == GeckoCommand.Type.BRAINSLUG_SEARCH:
-            info = f.read(4)
-            value = int.from_bytes(info, "big", signed=False)
-            size = int.from_bytes(metadata, "big", signed=False) & 0x000000FF
-            _code = BrainslugSearch(f.read(size << 3), address, [
-                                    (value & 0xFFFF0000) >> 16, value & 0xFFFF])
-            add_children_till_terminator(_code, f)
-            return _code
+        """Converts an array of bytes to a `GeckoCommand` and returns the result, or None if the stream is exhausted"""
+        if isinstance(f, (bytes, bytearray, memoryview)):
+            return _bytes_to_command(f, 0)[0]
+
+        if isinstance(f, BytesIO):
+            with f.getbuffer() as buf:
+                command, offset = _bytes_to_command(buf, f.tell())
+            f.seek(offset)
+            return command
+
+        buf = _StreamBuffer(f)
+        command, offset = _bytes_to_command(buf, 0)
+        f.seek(buf.start + offset)
+        return command
 
     @staticmethod
     def str_to_geckocommand(f: Union[StringIO, str]) -> "GeckoCommand":
-        """Converts text to a `GeckoCommand` and returns the result"""
-
-        def add_children_till_terminator(code: "GeckoCommand", f: StringIO):
-            while f.tell() < _get_io_length(f):
-                child = GeckoCommand.str_to_geckocommand(f)
-                if child is None:
-                    raise InvalidGeckoCommandError("Data passed to text parser did not resolve to a command!")
-                if child.codetype in {GeckoCommand.Type.TERMINATOR, GeckoCommand.Type.EXIT}:
-                    f.seek(f.tell() - 17)
-                    return
-                code.add_child(child)
+        """Converts text to a `GeckoCommand` and returns the result, or None if the stream is exhausted"""
 
         if not isinstance(f, StringIO):
             f = StringIO(f)
 
         _oldpos = f.tell()
-        line = f.readline().strip()
-        metadata = bytes.fromhex(line[:8])
+        line = f.readline()
+        if line == "":
+            return None
 
-        address = int.from_bytes(
-            metadata, byteorder="big", signed=False) & 0x1FFFFFF
-        try:
-            codetype = GeckoCommand.int_to_type((int.from_bytes(
-                metadata, "big", signed=False) >> 24) & 0xFE)
-        except ValueError:
+        line = bytes.fromhex(line)
+        metadata = int.from_bytes(line[:4], "big", signed=False)
+        info = int.from_bytes(line[4:], "big", signed=False)
+
+        parser = _StrOpcodeParsers[metadata >> 24]
+        if parser is None:
             f.seek(_oldpos, 0)
             return GeckoCommand._BadCommandTextCB(f)
-        isPointerType = ((int.from_bytes(
-            metadata, "big", signed=False) >> 24) & 0x10 != 0)
-
-        if codetype == GeckoCommand.Type.WRITE_8:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info[3:], "big", signed=False)
-            repeat = int.from_bytes(info[:2], "big", signed=False)
-            return Write8(value, address, repeat, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_16:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info[2:], "big", signed=False)
-            repeat = int.from_bytes(info[:2], "big", signed=False)
-            return Write16(value, address, repeat, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_32:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            return Write32(value, address, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_STR:
-            info = bytes.fromhex(line[-8:])
-            size = int.from_bytes(info, "big", signed=False)
-            data = b""
-            for _ in range(((size + 7) & -8) >> 3):
-                data += bytes.fromhex("".join(f.readline().strip().split()))
-            diff = size - len(data)
-            if diff != 0:
-                data = data[:size - len(data)]
-            return WriteString(data, address, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_SERIAL:
-            info = bytes.fromhex("".join(f.readline().strip().split()))
-            value = int(line[-8:], 16)
-            valueSize = int.from_bytes(info[:1], "big", signed=False) >> 4
-            repeat = int.from_bytes(info[:2], "big", signed=False) & 0xFFF
-            addressInc = int.from_bytes(info[2:4], "big", signed=False)
-            valueInc = int.from_bytes(info[4:8], "big", signed=False)
-            return WriteSerial(value, address, repeat, isPointerType, valueSize, addressInc, valueInc)
-        elif codetype == GeckoCommand.Type.IF_EQ_32:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfEqual32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_NEQ_32:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfNotEqual32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_GT_32:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfGreaterThan32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_LT_32:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            _code = IfLesserThan32(value, address, endif=(address & 1) == 1)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_EQ_16:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfEqual16(value, address, endif=(
-                address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_NEQ_16:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfNotEqual16(value, address, endif=(
-                address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_GT_16:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfGreaterThan16(
-                value, address, endif=(address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.IF_LT_16:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            mask = (int.from_bytes(info, "big", signed=False) >> 16) & 0xFFFF
-            _code = IfLesserThan16(
-                value, address, endif=(address & 1) == 1, mask=mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.BASE_ADDR_LOAD:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressLoad(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.BASE_ADDR_SET:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressSet(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.BASE_ADDR_STORE:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressStore(value, flags & 0x00110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.BASE_GET_NEXT:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return BaseAddressGetNext(value)
-        elif codetype == GeckoCommand.Type.PTR_ADDR_LOAD:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressLoad(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.PTR_ADDR_SET:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressSet(value, flags & 0x01110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.PTR_ADDR_STORE:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressStore(value, flags & 0x00110000, flags & 0xF, isPointerType)
-        elif codetype == GeckoCommand.Type.PTR_GET_NEXT:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = int.from_bytes(metadata, "big", signed=False)
-            return PointerAddressGetNext(value)
-        elif codetype == GeckoCommand.Type.REPEAT_SET:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            repeat = int.from_bytes(metadata, "big", signed=False) & 0xFFFF
-            return SetRepeat(repeat, value)
-        elif codetype == GeckoCommand.Type.REPEAT_EXEC:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            return ExecuteRepeat(value)
-        elif codetype == GeckoCommand.Type.RETURN:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00300000) >> 20
-            return Return(value)
-        elif codetype == GeckoCommand.Type.GOTO:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(metadata, "big", signed=False) & 0xFFFF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00300000) >> 20
-            return Goto(flags, value)
-        elif codetype == GeckoCommand.Type.GOSUB:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(metadata, "big", signed=False) & 0xFFFF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00300000) >> 20
-            register = int.from_bytes(info, "big", signed=False) & 0xF
-            return Gosub(flags, value, register)
-        elif codetype == GeckoCommand.Type.GECKO_REG_SET:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00110000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return GeckoRegisterSet(value, flags, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_REG_LOAD:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00310000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return GeckoRegisterLoad(value, flags, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_REG_STORE:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00310000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            repeat = (int.from_bytes(metadata, "big",
-                                     signed=False) & 0xFFF0) >> 4
-            return GeckoRegisterStore(value, repeat, flags, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_REG_OPERATE_I:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00030000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            opType = GeckoCommand.ArithmeticType(
-                (int.from_bytes(metadata, "big", signed=False) & 0x00F00000) >> 18)
-            return GeckoRegisterOperateI(value, opType, flags, register)
-        elif codetype == GeckoCommand.Type.GECKO_REG_OPERATE:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False) & 0xF
-            flags = (int.from_bytes(metadata, "big",
-                                    signed=False) & 0x00030000) >> 16
-            register = int.from_bytes(metadata, "big", signed=False) & 0xF
-            opType = GeckoCommand.ArithmeticType(
-                (int.from_bytes(metadata, "big", signed=False) & 0x00F00000) >> 18)
-            return GeckoRegisterOperate(value, opType, flags, register)
-        elif codetype == GeckoCommand.Type.MEMCPY_1:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            size = (int.from_bytes(metadata, "big",
-                                   signed=False) & 0x00FFFF00) >> 8
-            register = (int.from_bytes(
-                metadata, "big", signed=False) & 0xF0) >> 4
-            otherRegister = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return MemoryCopyTo(value, size, otherRegister, register, isPointerType)
-        elif codetype == GeckoCommand.Type.MEMCPY_2:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            size = (int.from_bytes(metadata, "big",
-                                   signed=False) & 0x00FFFF00) >> 8
-            register = (int.from_bytes(
-                metadata, "big", signed=False) & 0xF0) >> 4
-            otherRegister = int.from_bytes(metadata, "big", signed=False) & 0xF
-            return MemoryCopyFrom(value, size, otherRegister, register, isPointerType)
-        elif codetype == GeckoCommand.Type.GECKO_IF_EQ_16:
-            info = bytes.fromhex(line[-8:])
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfEqual16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.GECKO_IF_NEQ_16:
-            info = bytes.fromhex(line[-8:])
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfNotEqual16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.GECKO_IF_GT_16:
-            info = bytes.fromhex(line[-8:])
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfGreaterThan16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.GECKO_IF_LT_16:
-            info = bytes.fromhex(line[-8:])
-            register = (int.from_bytes(info, "big", signed=False)
-                        & 0x0F000000) >> 24
-            otherRegister = (int.from_bytes(
-                info, "big", signed=False) & 0xF0000000) >> 28
-            mask = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = GeckoIfLesserThan16(
-                address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_EQ_16:
-            info = bytes.fromhex(line[-8:])
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfEqual16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_NEQ_16:
-            info = bytes.fromhex(line[-8:])
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfNotEqual16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_GT_16:
-            info = bytes.fromhex(line[-8:])
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfGreaterThan16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.COUNTER_IF_LT_16:
-            info = bytes.fromhex(line[-8:])
-            counter = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0xFFFF0) >> 4
-            flags = int.from_bytes(metadata, "big", signed=False) & 9
-            mask = (int.from_bytes(info, "big", signed=False) & 0xFFFF0000) >> 16
-            value = int.from_bytes(info, "big", signed=False) & 0xFFFF
-            _code = CounterIfLesserThan16(value, mask, flags, counter)
-            add_children_till_terminator(_code, f)
-            return _code
-        elif codetype == GeckoCommand.Type.ASM_EXECUTE:
-            info = bytes.fromhex(line[-8:])
-            size = int.from_bytes(info, "big", signed=False)
-            data = b""
-            for _ in range(size):
-                data += bytes.fromhex("".join(f.readline().strip().split()))
-            return AsmExecute(data)
-        elif codetype == GeckoCommand.Type.ASM_INSERT:
-            info = bytes.fromhex(line[-8:])
-            size = int.from_bytes(info, "big", signed=False)
-            data = b""
-            for _ in range(size):
-                data += bytes.fromhex("".join(f.readline().strip().split()))
-            return AsmInsert(data, address, isPointerType, isLink=(address & 1) != 0)
-        elif codetype == GeckoCommand.Type.ASM_INSERT_LINK:
-            info = bytes.fromhex(line[-8:])
-            size = int.from_bytes(info, "big", signed=False)
-            data = b""
-            for _ in range(size):
-                data += bytes.fromhex("".join(f.readline().strip().split()))
-            return AsmInsertLink(data, address, isPointerType)
-        elif codetype == GeckoCommand.Type.WRITE_BRANCH:
-            info = bytes.fromhex(line[-8:])
-            dest = int.from_bytes(info, "big", signed=False)
-            return WriteBranch(dest, address, isPointerType, isLink=(address & 1) != 0)
-        elif codetype == GeckoCommand.Type.SWITCH:
-            return Switch()
-        elif codetype == GeckoCommand.Type.ADDR_RANGE_CHECK:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            endif = int.from_bytes(metadata, "big", signed=False) & 0x1
-            return AddressRangeCheck(value, isPointerType, endif)
-        elif codetype == GeckoCommand.Type.TERMINATOR:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            return Terminator(value)
-        elif codetype == GeckoCommand.Type.ENDIF:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            inverse = (int.from_bytes(metadata, "big",
-                                      signed=False) & 0x00F00000) >> 24
-            numEndifs = int.from_bytes(metadata, "big", signed=False) & 0xFF
-            return Endif(value, inverse, numEndifs)
-        elif codetype == GeckoCommand.Type.EXIT:
-            f.seek(4, 1)
-            return Exit()
-        elif codetype == GeckoCommand.Type.ASM_INSERT_XOR:
-            info = bytes.fromhex(line[-8:])
-            size = int.from_bytes(info, "big", signed=False) & 0x000000FF
-            xor = int.from_bytes(info, "big", signed=False) & 0x00FFFF00
-            num = int.from_bytes(info, "big", signed=False) & 0xFF000000
-            pointer = codetype.value == 0xF4
-            data = b""
-            for _ in range(size):
-                data += bytes.fromhex("".join(f.readline().strip().split()))
-            return AsmInsertXOR(data, address, pointer, xor, num, isLink=(address & 1) != 0)
-        elif codetype == GeckoCommand.Type.BRAINSLUG_SEARCH:
-            info = bytes.fromhex(line[-8:])
-            value = int.from_bytes(info, "big", signed=False)
-            size = int.from_bytes(metadata, "big", signed=False) & 0x000000FF
-            data = b""
-            for _ in range(size):
-                data += bytes.fromhex("".join(f.readline().strip().split()))
-            _code = BrainslugSearch(data, address, [
-                                    (value & 0xFFFF0000) >> 16, value & 0xFFFF])
-            add_children_till_terminator(_code, f)
-            return _code
+
+        address = metadata & 0x1FFFFFF
+        isPointerType = ((metadata >> 24) & 0x10 != 0)
+
+        return parser(f, metadata, info, address, isPointerType)
 
     def __init__(self):
         raise InvalidGeckoCommandError(
             f"Cannot instantiate abstract type {self.__class__.__name__}")
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.__dict__})"
+        fields = {name: getattr(self, name) for cls in type(self).__mro__
+                  for name in getattr(cls, "__slots__", ()) if hasattr(self, name)}
+        return f"{self.__class__.__name__}({fields})"
 
     def __str__(self) -> str:
         return self.__class__.__name__
@@ -1051,28 +324,23 @@ class GeckoCommand():
         raise IndexError
 
     def __hash__(self) -> int:
-        return int.from_bytes(self.as_bytes(), "big", signed=False)
+        return hash(self.as_bytes())
 
     def __eq__(self, other: Union["GeckoCommand", type]) -> bool:
         if type(other) == type:
             return self.codetype == other.codetype
+        elif isinstance(other, GeckoCommand):
+            return self.as_bytes() == other.as_bytes()
         else:
             return hash(self) == hash(other)
 
     def __ne__(self, other: Union["GeckoCommand", type]) -> bool:
-        if type(other) == type:
-            return self.codetype != other.codetype
-        else:
-            return hash(self) != hash(other)
+        return not self == other
 
     @property
     def children(self) -> List["GeckoCommand"]:
         return []
 
-    @classproperty
-    def codetype(cls) -> Type:
-        return None
-
     @property
     def value(self) -> Union[int, bytes]:
         return None
@@ -1145,29 +413,84 @@ class GeckoCommand():
 
     def as_text(self) -> str:
         """Return this GeckoCommand as its textual form (As generally found in documentation)"""
-        packet = self.as_bytes()
-        nibbles = [packet[i:i+4] for i in range(0, len(packet), 4)]
-        stringRepr = ""
-        for i, nibble in enumerate(nibbles):
-            if i > 0:
-                if i % 2:
-                    stringRepr += f" {nibble.hex()}"
-                else:
-                    stringRepr += f"\n{nibble.hex()}"
-            else:
-                stringRepr += f"{nibble.hex()}"
-        return stringRepr.upper()
+        packet = self.as_bytes().hex().upper()
+        words = [packet[i:i+8] for i in range(0, len(packet), 8)]
+        return "\n".join(" ".join(words[i:i+2]) for i in range(0, len(words), 2))
+
+
+def _opcode_to_type(id: int) -> Optional[GeckoCommand.Type]:
+    if id == 0xF4:
+        return GeckoCommand.Type.ASM_INSERT_XOR
+    try:
+        return GeckoCommand.Type(id if id >= 0xF0 else id & 0xEE)
+    except ValueError:
+        return None
+
+
+_TypeFromOpcode: Tuple[Optional[GeckoCommand.Type], ...] = tuple(_opcode_to_type(id & 0xFE) for id in range(0x100))
+
+_IfBlockTypes = frozenset({
+    GeckoCommand.Type.IF_EQ_32,
+    GeckoCommand.Type.IF_NEQ_32,
+    GeckoCommand.Type.IF_GT_32,
+    GeckoCommand.Type.IF_LT_32,
+    GeckoCommand.Type.IF_EQ_16,
+    GeckoCommand.Type.IF_NEQ_16,
+    GeckoCommand.Type.IF_GT_16,
+    GeckoCommand.Type.IF_LT_16,
+    GeckoCommand.Type.GECKO_IF_EQ_16,
+    GeckoCommand.Type.GECKO_IF_NEQ_16,
+    GeckoCommand.Type.GECKO_IF_GT_16,
+    GeckoCommand.Type.GECKO_IF_LT_16,
+    GeckoCommand.Type.COUNTER_IF_EQ_16,
+    GeckoCommand.Type.COUNTER_IF_NEQ_16,
+    GeckoCommand.Type.COUNTER_IF_GT_16,
+    GeckoCommand.Type.COUNTER_IF_LT_16,
+    GeckoCommand.Type.BRAINSLUG_SEARCH,
+})
+
+_MultilineTypes = frozenset({
+    GeckoCommand.Type.WRITE_STR,
+    GeckoCommand.Type.WRITE_SERIAL,
+    GeckoCommand.Type.ASM_EXECUTE,
+    GeckoCommand.Type.ASM_INSERT,
+    GeckoCommand.Type.ASM_INSERT_XOR,
+    GeckoCommand.Type.BRAINSLUG_SEARCH,
+})
+
+_PreprocessTypes = frozenset({
+    GeckoCommand.Type.WRITE_8,
+    GeckoCommand.Type.WRITE_16,
+    GeckoCommand.Type.WRITE_32,
+    GeckoCommand.Type.WRITE_STR,
+    GeckoCommand.Type.WRITE_SERIAL,
+    GeckoCommand.Type.WRITE_BRANCH,
+})
+
+_BlockEndTypes = frozenset({GeckoCommand.Type.TERMINATOR, GeckoCommand.Type.EXIT})
 
 
 class Write8(GeckoCommand):
+    codetype = GeckoCommand.Type.WRITE_8
+    __slots__ = ("_value", "_address", "_repeat", "_isPointer")
+
     def __init__(self, value: Union[int, bytes], address: int = 0, repeat: int = 0, isPointer: bool = False):
         self.value = value
         self._address = address & 0x1FFFFFF
         self._repeat = repeat
         self._isPointer = isPointer
 
+    @classmethod
+    def _from_fields(cls, value: int, address: int, repeat: int, isPointer: bool):
+        self = cls.__new__(cls)
+        self._value = value
+        self._address = address
+        self._repeat = repeat
+        self._isPointer = isPointer
+        return self
+
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         if self._repeat > 0:
@@ -1194,10 +517,6 @@ class Write8(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.WRITE_8
-
     @property
     def value(self) -> int:
         return self._value & 0xFF
@@ -1221,33 +540,42 @@ class Write8(GeckoCommand):
         addr = self._address | 0x80000000
         if dol.is_mapped(addr) and self.is_ba_type():
             dol.seek(addr)
-            counter = self._repeat
-            while counter + 1 > 0:
-                dol.write(self.value.to_bytes(1, "big", signed=False))
-                counter -= 1
+            dol.write(self.value.to_bytes(1, "big", signed=False) * (self._repeat + 1))
             return True
         return False
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address & 0x1FFFFFF)
         info = (self._repeat << 16) | self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Write16(GeckoCommand):
+    codetype = GeckoCommand.Type.WRITE_16
+    __slots__ = ("_value", "_address", "_repeat", "_isPointer")
+
     def __init__(self, value: Union[int, bytes], address: int = 0, repeat: int = 0, isPointer: bool = False):
         self.value = value
         self._address = address & 0x1FFFFFF
         self._repeat = repeat
         self._isPointer = isPointer
 
+    @classmethod
+    def _from_fields(cls, value: int, address: int, repeat: int, isPointer: bool):
+        self = cls.__new__(cls)
+        self._value = value
+        self._address = address
+        self._repeat = repeat
+        self._isPointer = isPointer
+        return self
+
     def __len__(self) -> int:
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         if self._repeat > 0:
@@ -1271,10 +599,6 @@ class Write16(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.WRITE_16
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFF
@@ -1298,32 +622,40 @@ class Write16(GeckoCommand):
         addr = self._address | 0x80000000
         if dol.is_mapped(addr) and self.is_ba_type():
             dol.seek(addr)
-            counter = self._repeat
-            while counter + 1 > 0:
-                dol.write(self.value.to_bytes(2, "big", signed=False))
-                counter -= 1
+            dol.write(self.value.to_bytes(2, "big", signed=False) * (self._repeat + 1))
             return True
         return False
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address & 0x1FFFFFE)
         info = (self._repeat << 16) | self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Write32(GeckoCommand):
+    codetype = GeckoCommand.Type.WRITE_32
+    __slots__ = ("_value", "_address", "_isPointer")
+
     def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False):
         self.value = value
         self._address = address & 0x1FFFFFF
         self._isPointer = isPointer
 
+    @classmethod
+    def _from_fields(cls, value: int, address: int, isPointer: bool):
+        self = cls.__new__(cls)
+        self._value = value
+        self._address = address
+        self._isPointer = isPointer
+        return self
+
     def __len__(self) -> int:
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         return f"({intType:02X}) Write word 0x{self.value:08X} to 0x{self._address:08X} + the {addrstr}"
@@ -1344,10 +676,6 @@ class Write32(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.WRITE_32
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -1376,14 +704,17 @@ class Write32(GeckoCommand):
         return False
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address & 0x1FFFFFC)
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class WriteString(GeckoCommand):
+    codetype = GeckoCommand.Type.WRITE_STR
+    __slots__ = ("_value", "_address", "_isPointer")
+
     def __init__(self, value: Union[bytes, str], address: int = 0, isPointer: bool = False):
         self.value = value
         self._address = address & 0x1FFFFFF
@@ -1393,7 +724,7 @@ class WriteString(GeckoCommand):
         return 8 + len(self.value)
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         return f"({intType:02X}) Write {len(self) - 8} bytes to 0x{self._address:08X} + the {addrstr}"
@@ -1407,10 +738,6 @@ class WriteString(GeckoCommand):
                 f"Cannot assign {value.__class__.__name__} to the data of {self.__class__.__name__}")
         self.value[index] = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.WRITE_STR
-
     @property
     def value(self) -> bytes:
         return self._value
@@ -1439,14 +766,17 @@ class WriteString(GeckoCommand):
         return False
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address & 0x1FFFFFF)
         info = len(self.value)
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + _align_bytes(self.value, alignment=8)
+        return _pack_header(metadata, info) + _align_bytes(self.value, alignment=8)
 
 
 class WriteSerial(GeckoCommand):
+    codetype = GeckoCommand.Type.WRITE_SERIAL
+    __slots__ = ("_value", "valueInc", "_valueSize", "_address", "_addressInc", "_repeat", "_isPointer")
+
     def __init__(self, value: Union[int, bytes], address: int = 0, repeat: int = 0, isPointer: bool = False,
                  valueSize: int = 2, addrInc: int = 4, valueInc: int = 0):
         self.value = value
@@ -1461,7 +791,7 @@ class WriteSerial(GeckoCommand):
         return 16
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         valueType = ("byte", "short", "word")[self._valueSize]
@@ -1471,12 +801,18 @@ class WriteSerial(GeckoCommand):
         else:
             return f"({intType:02X}) Write {valueType} 0x{self.value:08X} to 0x{self._address:08X} + the {addrstr})"
 
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        address, addressInc = self._address, self._addressInc
+        value, valueInc = self.value, self.valueInc
+        for i in range(self._repeat + 1):
+            yield (address + addressInc*i, value + valueInc*i)
+
     def __getitem__(self, index: int) -> Tuple[int, int]:
-        if index > self._repeat:
+        if not -(self._repeat + 1) <= index <= self._repeat:
             raise IndexError(
                 f"Index [{index}] is beyond the virtual code size")
         elif index < 0:
-            index += self._repeat
+            index += self._repeat + 1
 
         return (self._address + self._addressInc*index,
                 self.value + self.valueInc*index)
@@ -1491,10 +827,6 @@ class WriteSerial(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.WRITE_SERIAL
-
     @property
     def value(self) -> int:
         return self._value
@@ -1517,6 +849,10 @@ class WriteSerial(GeckoCommand):
     def apply(self, dol: DolFile) -> bool:
         addr = self._address | 0x80000000
         if dol.is_mapped(addr) and self.is_ba_type():
+            if self._addressInc == 4:
+                dol.seek(addr)
+                dol.write(b"".join([value.to_bytes(4, "big", signed=False) for _, value in self]))
+                return True
             for addr, value in self:
                 dol.seek(addr | 0x80000000)
                 dol.write(value.to_bytes(4, "big", signed=False))
@@ -1524,113 +860,20 @@ class WriteSerial(GeckoCommand):
         return False
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address & 0x1FFFFFF)
         info = self.value
         subinfo = (self._valueSize << 28) | (
             self._repeat << 16) | (self._addressInc)
         valueInc = self.valueInc
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + subinfo.to_bytes(4, "big", signed=False) + valueInc.to_bytes(4, "big", signed=False)
-
-
-class IfEqual32(GeckoCommand):
-    def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
-                 endif: bool = False):
-        self.value = value
-        self._address = (address & ~1) & 0x1FFFFFF
-        self._endif = endif
-        self._isPointer = isPointer
-        self._children = []
-
-    def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
-
-    def __str__(self) -> str:
-        if len(self.children) > 0:
-            GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
-        else:
-            childrenPrint = ""
-
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        addrstr = "pointer address" if self._isPointer else "base address"
-        endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the word at address (0x{self._address:08X} + the {addrstr}) is equal to 0x{self.value:08X}:{childrenPrint}"
-
-    def __getitem__(self, index: int) -> GeckoCommand:
-        return self._children[index]
-
-    def __setitem__(self, index: int, value: GeckoCommand):
-        if not isinstance(value, GeckoCommand):
-            raise InvalidGeckoCommandError(
-                f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
-
-        self._children[index] = value
-
-    @property
-    def children(self) -> List["GeckoCommand"]:
-        return self._children
-
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_EQ_32
-
-    @property
-    def value(self) -> int:
-        return self._value & 0xFFFFFFFF
-
-    @value.setter
-    def value(self, value: Union[int, bytes]):
-        if isinstance(value, bytes):
-            value = int.from_bytes(value, "big", signed=False)
-        self._value = value & 0xFFFFFFFF
-
-    def add_child(self, child: "GeckoCommand", index: int = -1):
-        if index < 0:
-            self._children.append(child)
-        else:
-            self._children.insert(index, child)
-
-    def remove_child(self, child: "GeckoCommand"):
-        self._children.remove(child)
-
-    def virtual_length(self) -> int:
-        return len(self.children) + 1
-
-    def is_ba_type(self) -> bool:
-        return not self._isPointer
-
-    def is_po_type(self) -> bool:
-        return self._isPointer
-
-    def get_endifs(self) -> int:
-        return 1 if self._endif else 0
+        return _pack_header(metadata, info) + _pack_header(subinfo, valueInc)
 
-    def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
-
-    def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        metadata = (intType << 24) | (self._address &
-                                      0x1FFFFFC) | (1 if self._endif else 0)
-        info = self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
 
+class _IfCompare32(GeckoCommand):
+    __slots__ = ("_value", "_address", "_endif", "_isPointer", "_children")
+    _comparison = ""
 
-class IfNotEqual32(GeckoCommand):
     def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
                  endif: bool = False):
         self.value = value
@@ -1640,22 +883,30 @@ class IfNotEqual32(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the word at address (0x{self._address:08X} + the {addrstr}) is not equal to 0x{self.value:08X}:{childrenPrint}"
+        return f"({intType:02X}) {endif}If the word at address (0x{self._address:08X} + the {addrstr}) {self._comparison} 0x{self.value:08X}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -1671,10 +922,6 @@ class IfNotEqual32(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_NEQ_32
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -1707,605 +954,109 @@ class IfNotEqual32(GeckoCommand):
         return 1 if self._endif else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFC) | (1 if self._endif else 0)
         info = self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
-class IfGreaterThan32(GeckoCommand):
+class _IfCompare16(_IfCompare32):
+    __slots__ = ("_mask",)
+
     def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
-                 endif: bool = False):
+                 endif: bool = False, mask: int = 0xFFFF):
         self.value = value
         self._address = (address & ~1) & 0x1FFFFFF
         self._endif = endif
+        self._mask = mask
         self._isPointer = isPointer
         self._children = []
 
-    def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
-
-    def __str__(self) -> str:
-        if len(self.children) > 0:
-            GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
-        else:
-            childrenPrint = ""
-
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+    def _header_str(self) -> str:
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the word at address (0x{self._address:08X} + the {addrstr}) is greater than 0x{self.value:08X}:{childrenPrint}"
-
-    def __getitem__(self, index: int) -> GeckoCommand:
-        return self._children[index]
-
-    def __setitem__(self, index: int, value: GeckoCommand):
-        if not isinstance(value, GeckoCommand):
-            raise InvalidGeckoCommandError(
-                f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
-
-        self._children[index] = value
-
-    @property
-    def children(self) -> List["GeckoCommand"]:
-        return self._children
-
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_GT_32
+        return f"({intType:02X}) {endif}If the short at address (0x{self._address:08X} + the {addrstr}) & ~0x{self._mask:04X} {self._comparison} 0x{self.value:08X}:"
 
     @property
     def value(self) -> int:
-        return self._value & 0xFFFFFFFF
+        return self._value & 0xFFFF
 
     @value.setter
     def value(self, value: Union[int, bytes]):
         if isinstance(value, bytes):
             value = int.from_bytes(value, "big", signed=False)
-        self._value = value & 0xFFFFFFFF
-
-    def add_child(self, child: "GeckoCommand", index: int = -1):
-        if index < 0:
-            self._children.append(child)
-        else:
-            self._children.insert(index, child)
-
-    def remove_child(self, child: "GeckoCommand"):
-        self._children.remove(child)
-
-    def virtual_length(self) -> int:
-        return len(self.children) + 1
-
-    def is_ba_type(self) -> bool:
-        return not self._isPointer
-
-    def is_po_type(self) -> bool:
-        return self._isPointer
-
-    def get_endifs(self) -> int:
-        return 1 if self._endif else 0
-
-    def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        self._value = value & 0xFFFF
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
-                                      0x1FFFFFC) | (1 if self._endif else 0)
-        info = self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
-
-
-class IfLesserThan32(GeckoCommand):
-    def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
-                 endif: bool = False):
-        self.value = value
-        self._address = (address & ~1) & 0x1FFFFFF
-        self._endif = endif
-        self._isPointer = isPointer
-        self._children = []
-
-    def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
-
-    def __str__(self) -> str:
-        if len(self.children) > 0:
-            GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
-        else:
-            childrenPrint = ""
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        addrstr = "pointer address" if self._isPointer else "base address"
-        endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the word at address (0x{self._address:08X} + the {addrstr}) is lesser than 0x{self.value:08X}:"
-
-    def __getitem__(self, index: int) -> GeckoCommand:
-        return self._children[index]
-
-    def __setitem__(self, index: int, value: GeckoCommand):
-        if not isinstance(value, GeckoCommand):
-            raise InvalidGeckoCommandError(
-                f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
-
-        self._children[index] = value
-
-    @property
-    def children(self) -> List["GeckoCommand"]:
-        return self._children
-
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_LT_32
-
-    @property
-    def value(self) -> int:
-        return self._value & 0xFFFFFFFF
-
-    @value.setter
-    def value(self, value: Union[int, bytes]):
-        if isinstance(value, bytes):
-            value = int.from_bytes(value, "big", signed=False)
-        self._value = value & 0xFFFFFFFF
-
-    def add_child(self, child: "GeckoCommand", index: int = -1):
-        if index < 0:
-            self._children.append(child)
-        else:
-            self._children.insert(index, child)
+                                      0x1FFFFFE) | (1 if self._endif else 0)
+        info = (self._mask << 16) | self.value
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
-    def remove_child(self, child: "GeckoCommand"):
-        self._children.remove(child)
 
-    def virtual_length(self) -> int:
-        return len(self.children) + 1
+class IfEqual32(_IfCompare32):
+    codetype = GeckoCommand.Type.IF_EQ_32
+    __slots__ = ()
+    _comparison = "is equal to"
 
-    def is_ba_type(self) -> bool:
-        return not self._isPointer
 
-    def is_po_type(self) -> bool:
-        return self._isPointer
-
-    def get_endifs(self) -> int:
-        return 1 if self._endif else 0
-
-    def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
-
-    def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        metadata = (intType << 24) | (self._address &
-                                      0x1FFFFFC) | (1 if self._endif else 0)
-        info = self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
-
-
-class IfEqual16(GeckoCommand):
-    def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
-                 endif: bool = False, mask: int = 0xFFFF):
-        self.value = value
-        self._address = (address & ~1) & 0x1FFFFFF
-        self._endif = endif
-        self._mask = mask
-        self._isPointer = isPointer
-        self._children = []
-
-    def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
-
-    def __str__(self) -> str:
-        if len(self.children) > 0:
-            GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
-        else:
-            childrenPrint = ""
-
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        addrstr = "pointer address" if self._isPointer else "base address"
-        endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the short at address (0x{self._address:08X} + the {addrstr}) & ~0x{self._mask:04X} is equal to 0x{self.value:08X}:{childrenPrint}"
-
-    def __getitem__(self, index: int) -> GeckoCommand:
-        return self._children[index]
-
-    def __setitem__(self, index: int, value: GeckoCommand):
-        if not isinstance(value, GeckoCommand):
-            raise InvalidGeckoCommandError(
-                f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
-
-        self._children[index] = value
-
-    @property
-    def children(self) -> List["GeckoCommand"]:
-        return self._children
-
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_EQ_16
-
-    @property
-    def value(self) -> int:
-        return self._value & 0xFFFF
-
-    @value.setter
-    def value(self, value: Union[int, bytes]):
-        if isinstance(value, bytes):
-            value = int.from_bytes(value, "big", signed=False)
-        self._value = value & 0xFFFF
-
-    def add_child(self, child: "GeckoCommand", index: int = -1):
-        if index < 0:
-            self._children.append(child)
-        else:
-            self._children.insert(index, child)
-
-    def remove_child(self, child: "GeckoCommand"):
-        self._children.remove(child)
-
-    def virtual_length(self) -> int:
-        return len(self.children) + 1
-
-    def is_ba_type(self) -> bool:
-        return not self._isPointer
-
-    def is_po_type(self) -> bool:
-        return self._isPointer
-
-    def get_endifs(self) -> int:
-        return 1 if self._endif else 0
-
-    def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
-
-    def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        metadata = (intType << 24) | (self._address &
-                                      0x1FFFFFE) | (1 if self._endif else 0)
-        info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
-
-
-class IfNotEqual16(GeckoCommand):
-    def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
-                 endif: bool = False, mask: int = 0xFFFF):
-        self.value = value
-        self._address = (address & ~1) & 0x1FFFFFF
-        self._endif = endif
-        self._mask = mask
-        self._isPointer = isPointer
-        self._children = []
-
-    def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
-
-    def __str__(self) -> str:
-        if len(self.children) > 0:
-            GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
-        else:
-            childrenPrint = ""
-
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        addrstr = "pointer address" if self._isPointer else "base address"
-        endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the short at address (0x{self._address:08X} + the {addrstr}) & ~0x{self._mask:04X} is not equal to 0x{self.value:08X}:{childrenPrint}"
-
-    def __getitem__(self, index: int) -> GeckoCommand:
-        return self._children[index]
-
-    def __setitem__(self, index: int, value: GeckoCommand):
-        if not isinstance(value, GeckoCommand):
-            raise InvalidGeckoCommandError(
-                f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
-
-        self._children[index] = value
-
-    @property
-    def children(self) -> List["GeckoCommand"]:
-        return self._children
-
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_NEQ_16
-
-    @property
-    def value(self) -> int:
-        return self._value & 0xFFFF
-
-    @value.setter
-    def value(self, value: Union[int, bytes]):
-        if isinstance(value, bytes):
-            value = int.from_bytes(value, "big", signed=False)
-        self._value = value & 0xFFFF
-
-    def add_child(self, child: "GeckoCommand", index: int = -1):
-        if index < 0:
-            self._children.append(child)
-        else:
-            self._children.insert(index, child)
-
-    def remove_child(self, child: "GeckoCommand"):
-        self._children.remove(child)
-
-    def virtual_length(self) -> int:
-        return len(self.children) + 1
-
-    def is_ba_type(self) -> bool:
-        return not self._isPointer
-
-    def is_po_type(self) -> bool:
-        return self._isPointer
-
-    def get_endifs(self) -> int:
-        return 1 if self._endif else 0
-
-    def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
-
-    def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        metadata = (intType << 24) | (self._address &
-                                      0x1FFFFFE) | (1 if self._endif else 0)
-        info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
-
-
-class IfGreaterThan16(GeckoCommand):
-    def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
-                 endif: bool = False, mask: int = 0xFFFF):
-        self.value = value
-        self._address = (address & ~1) & 0x1FFFFFF
-        self._endif = endif
-        self._mask = mask
-        self._isPointer = isPointer
-        self._children = []
-
-    def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
-
-    def __str__(self) -> str:
-        if len(self.children) > 0:
-            GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
-        else:
-            childrenPrint = ""
-
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        addrstr = "pointer address" if self._isPointer else "base address"
-        endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the short at address (0x{self._address:08X} + the {addrstr}) & ~0x{self._mask:04X} is greater than 0x{self.value:08X}:{childrenPrint}"
-
-    def __getitem__(self, index: int) -> GeckoCommand:
-        return self._children[index]
-
-    def __setitem__(self, index: int, value: GeckoCommand):
-        if not isinstance(value, GeckoCommand):
-            raise InvalidGeckoCommandError(
-                f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
-
-        self._children[index] = value
-
-    @property
-    def children(self) -> List["GeckoCommand"]:
-        return self._children
-
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_GT_16
-
-    @property
-    def value(self) -> int:
-        return self._value & 0xFFFF
-
-    @value.setter
-    def value(self, value: Union[int, bytes]):
-        if isinstance(value, bytes):
-            value = int.from_bytes(value, "big", signed=False)
-        self._value = value & 0xFFFF
-
-    def add_child(self, child: "GeckoCommand", index: int = -1):
-        if index < 0:
-            self._children.append(child)
-        else:
-            self._children.insert(index, child)
-
-    def remove_child(self, child: "GeckoCommand"):
-        self._children.remove(child)
-
-    def virtual_length(self) -> int:
-        return len(self.children) + 1
-
-    def is_ba_type(self) -> bool:
-        return not self._isPointer
-
-    def is_po_type(self) -> bool:
-        return self._isPointer
-
-    def get_endifs(self) -> int:
-        return 1 if self._endif else 0
-
-    def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
-
-    def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        metadata = (intType << 24) | (self._address &
-                                      0x1FFFFFE) | (1 if self._endif else 0)
-        info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
-
-
-class IfLesserThan16(GeckoCommand):
-    def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False,
-                 endif: bool = False, mask: int = 0xFFFF):
-        self.value = value
-        self._address = (address & ~1) & 0x1FFFFFF
-        self._endif = endif
-        self._mask = mask
-        self._isPointer = isPointer
-        self._children = []
-
-    def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
-
-    def __str__(self) -> str:
-        if len(self.children) > 0:
-            GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
-        else:
-            childrenPrint = ""
-
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        addrstr = "pointer address" if self._isPointer else "base address"
-        endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If the short at address (0x{self._address:08X} + the {addrstr}) & ~0x{self._mask:04X} is lesser than 0x{self.value:08X}:{childrenPrint}"
-
-    def __getitem__(self, index: int) -> GeckoCommand:
-        return self._children[index]
-
-    def __setitem__(self, index: int, value: GeckoCommand):
-        if not isinstance(value, GeckoCommand):
-            raise InvalidGeckoCommandError(
-                f"Cannot assign {value.__class__.__name__} as a child of {self.__class__.__name__}")
-
-        self._children[index] = value
-
-    @property
-    def children(self) -> List["GeckoCommand"]:
-        return self._children
+class IfNotEqual32(_IfCompare32):
+    codetype = GeckoCommand.Type.IF_NEQ_32
+    __slots__ = ()
+    _comparison = "is not equal to"
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.IF_LT_16
 
-    @property
-    def value(self) -> int:
-        return self._value & 0xFFFF
+class IfGreaterThan32(_IfCompare32):
+    codetype = GeckoCommand.Type.IF_GT_32
+    __slots__ = ()
+    _comparison = "is greater than"
 
-    @value.setter
-    def value(self, value: Union[int, bytes]):
-        if isinstance(value, bytes):
-            value = int.from_bytes(value, "big", signed=False)
-        self._value = value & 0xFFFF
 
-    def add_child(self, child: "GeckoCommand", index: int = -1):
-        if index < 0:
-            self._children.append(child)
-        else:
-            self._children.insert(index, child)
+class IfLesserThan32(_IfCompare32):
+    codetype = GeckoCommand.Type.IF_LT_32
+    __slots__ = ()
+    _comparison = "is lesser than"
 
-    def remove_child(self, child: "GeckoCommand"):
-        self._children.remove(child)
 
-    def virtual_length(self) -> int:
-        return len(self.children) + 1
+class IfEqual16(_IfCompare16):
+    codetype = GeckoCommand.Type.IF_EQ_16
+    __slots__ = ()
+    _comparison = "is equal to"
 
-    def is_ba_type(self) -> bool:
-        return not self._isPointer
 
-    def is_po_type(self) -> bool:
-        return self._isPointer
+class IfNotEqual16(_IfCompare16):
+    codetype = GeckoCommand.Type.IF_NEQ_16
+    __slots__ = ()
+    _comparison = "is not equal to"
 
-    def get_endifs(self) -> int:
-        return 1 if self._endif else 0
 
-    def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+class IfGreaterThan16(_IfCompare16):
+    codetype = GeckoCommand.Type.IF_GT_16
+    __slots__ = ()
+    _comparison = "is greater than"
 
-    def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
-            0x10 if self._isPointer else 0)
-        metadata = (intType << 24) | (self._address &
-                                      0x1FFFFFE) | (1 if self._endif else 0)
-        info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+
+class IfLesserThan16(_IfCompare16):
+    codetype = GeckoCommand.Type.IF_LT_16
+    __slots__ = ()
+    _comparison = "is lesser than"
 
 
 class BaseAddressLoad(GeckoCommand):
+    codetype = GeckoCommand.Type.BASE_ADDR_LOAD
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -2315,7 +1066,7 @@ class BaseAddressLoad(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -2355,10 +1106,6 @@ class BaseAddressLoad(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.BASE_ADDR_LOAD
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -2379,14 +1126,17 @@ class BaseAddressLoad(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class BaseAddressSet(GeckoCommand):
+    codetype = GeckoCommand.Type.BASE_ADDR_SET
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -2396,7 +1146,7 @@ class BaseAddressSet(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -2437,10 +1187,6 @@ class BaseAddressSet(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.BASE_ADDR_SET
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -2461,14 +1207,17 @@ class BaseAddressSet(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class BaseAddressStore(GeckoCommand):
+    codetype = GeckoCommand.Type.BASE_ADDR_STORE
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -2478,7 +1227,7 @@ class BaseAddressStore(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -2511,10 +1260,6 @@ class BaseAddressStore(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.BASE_ADDR_STORE
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -2535,19 +1280,22 @@ class BaseAddressStore(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class BaseAddressGetNext(GeckoCommand):
+    codetype = GeckoCommand.Type.BASE_GET_NEXT
+    __slots__ = ()
+
     def __init__(self, value: int):
         self.value = value
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         return f"({intType:02X}) Set the base address to be the next Gecko Code's address + {self.value:04X}"
 
     def __len__(self) -> int:
@@ -2569,10 +1317,6 @@ class BaseAddressGetNext(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.BASE_GET_NEXT
-
     @property
     def value(self) -> int:
         return self.value & 0xFFFF
@@ -2587,12 +1331,15 @@ class BaseAddressGetNext(GeckoCommand):
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | self.value
-        return metadata.to_bytes(4, "big", signed=False) + b"\x00\x00\x00\x00"
+        return _pack_header(metadata, 0)
 
 
 class PointerAddressLoad(GeckoCommand):
+    codetype = GeckoCommand.Type.PTR_ADDR_LOAD
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -2602,7 +1349,7 @@ class PointerAddressLoad(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -2642,10 +1389,6 @@ class PointerAddressLoad(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.PTR_ADDR_LOAD
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -2666,14 +1409,17 @@ class PointerAddressLoad(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class PointerAddressSet(GeckoCommand):
+    codetype = GeckoCommand.Type.PTR_ADDR_SET
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -2683,7 +1429,7 @@ class PointerAddressSet(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -2724,10 +1470,6 @@ class PointerAddressSet(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.PTR_ADDR_SET
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -2748,14 +1490,17 @@ class PointerAddressSet(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class PointerAddressStore(GeckoCommand):
+    codetype = GeckoCommand.Type.PTR_ADDR_STORE
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -2765,7 +1510,7 @@ class PointerAddressStore(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -2798,10 +1543,6 @@ class PointerAddressStore(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.PTR_ADDR_STORE
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -2822,19 +1563,22 @@ class PointerAddressStore(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class PointerAddressGetNext(GeckoCommand):
+    codetype = GeckoCommand.Type.PTR_GET_NEXT
+    __slots__ = ()
+
     def __init__(self, value: int):
         self.value = value
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         return f"({intType:02X}) Set the base address to be the next Gecko Code's address + {self.value:04X}"
 
     def __len__(self) -> int:
@@ -2856,10 +1600,6 @@ class PointerAddressGetNext(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.PTR_GET_NEXT
-
     @property
     def value(self) -> int:
         return self.value & 0xFFFF
@@ -2874,69 +1614,70 @@ class PointerAddressGetNext(GeckoCommand):
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | self.value
-        return metadata.to_bytes(4, "big", signed=False) + b"\x00\x00\x00\x00"
+        return _pack_header(metadata, 0)
 
 
 class SetRepeat(GeckoCommand):
+    codetype = GeckoCommand.Type.REPEAT_SET
+    __slots__ = ("_repeat", "b")
+
     def __init__(self, repeat: int = 0, b: int = 0):
         self._repeat = repeat
         self.b = b
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         return f"({intType:02X}) Store next code address and number of times to repeat in b{self.b}"
 
     def __len__(self) -> int:
         return 8
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.REPEAT_SET
-
     def virtual_length(self) -> int:
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | self._repeat
         info = self.b
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class ExecuteRepeat(GeckoCommand):
+    codetype = GeckoCommand.Type.REPEAT_EXEC
+    __slots__ = ("b",)
+
     def __init__(self, b: int = 0):
         self.b = b
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         return f"({intType:02X}) If NNNN stored in b{self.b} is > 0, it is decreased by 1 and the code handler jumps to the next code address stored in b{self.b}"
 
     def __len__(self) -> int:
         return 8
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.REPEAT_EXEC
-
     def virtual_length(self) -> int:
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24)
         info = self.b
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Return(GeckoCommand):
+    codetype = GeckoCommand.Type.RETURN
+    __slots__ = ("b", "_flags")
+
     def __init__(self, flags: int = 0, b: int = 0):
         self.b = b
         self._flags = flags
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         if self._flags == 0:
             return f"({intType:02X}) If the code execution status is true, jump to the next code address stored in b{self.b} (NNNN in bP is not touched)"
         elif self._flags == 1:
@@ -2947,27 +1688,26 @@ class Return(GeckoCommand):
     def __len__(self) -> int:
         return 8
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.RETURN
-
     def virtual_length(self) -> int:
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._flags << 20)
         info = self.b
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Goto(GeckoCommand):
+    codetype = GeckoCommand.Type.GOTO
+    __slots__ = ("_flags", "_offset")
+
     def __init__(self, flags: int = 0, lineOffset: int = 0):
         self._flags = flags
         self._offset = lineOffset
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         if self._flags == 0:
             return f"({intType:02X}) If the code execution status is true, jump to (next line of code + {self._offset} lines)"
         elif self._flags == 1:
@@ -2978,27 +1718,26 @@ class Goto(GeckoCommand):
     def __len__(self) -> int:
         return 8
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GOTO
-
     def virtual_length(self) -> int:
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._flags << 20) | self._offset
-        return metadata.to_bytes(4, "big", signed=False) + b"\x00\x00\x00\x00"
+        return _pack_header(metadata, 0)
 
 
 class Gosub(GeckoCommand):
+    codetype = GeckoCommand.Type.GOSUB
+    __slots__ = ("_flags", "_offset", "_register")
+
     def __init__(self, flags: int = 0, lineOffset: int = 0, register: int = 0):
         self._flags = flags
         self._offset = lineOffset
         self._register = register
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         if self._flags == 0:
             return f"({intType:02X}) If the code execution status is true, store the next code address in b{self._register} and jump to (next line of code + {self._offset} lines)"
         elif self._flags == 1:
@@ -3009,21 +1748,20 @@ class Gosub(GeckoCommand):
     def __len__(self) -> int:
         return 8
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GOSUB
-
     def virtual_length(self) -> int:
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._flags << 20) | self._offset
         info = self._register
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class GeckoRegisterSet(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_REG_SET
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -3033,7 +1771,7 @@ class GeckoRegisterSet(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -3066,10 +1804,6 @@ class GeckoRegisterSet(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_REG_SET
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -3090,14 +1824,17 @@ class GeckoRegisterSet(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class GeckoRegisterLoad(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_REG_LOAD
+    __slots__ = ("_value", "_flags", "_register", "_isPointer")
+
     def __init__(self, value: int, flags: int = 0, register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
 
@@ -3107,7 +1844,7 @@ class GeckoRegisterLoad(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         flags = self._flags
@@ -3144,10 +1881,6 @@ class GeckoRegisterLoad(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_REG_LOAD
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -3168,14 +1901,17 @@ class GeckoRegisterLoad(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class GeckoRegisterStore(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_REG_STORE
+    __slots__ = ("_value", "_valueSize", "_flags", "_repeat", "_register", "_isPointer")
+
     def __init__(self, value: int, repeat: int = 0, flags: int = 0,
                  register: int = 0, valueSize: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
@@ -3188,7 +1924,7 @@ class GeckoRegisterStore(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         valueType = ("byte", "short", "word")[self._valueSize]
@@ -3227,10 +1963,6 @@ class GeckoRegisterStore(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_REG_STORE
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -3251,15 +1983,18 @@ class GeckoRegisterStore(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._flags << 12) | (
             self._repeat << 4) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class GeckoRegisterOperateI(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_REG_OPERATE_I
+    __slots__ = ("_value", "_opType", "_register", "_flags")
+
     def __init__(self, value: int, opType: GeckoCommand.ArithmeticType, flags: int = 0, register: int = 0):
         GeckoCommand.assert_register(register)
 
@@ -3269,7 +2004,7 @@ class GeckoRegisterOperateI(GeckoCommand):
         self._flags = flags
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         grAccessType = f"[Gecko Register {self._register}]" if (
             self._flags & 1) != 0 else f"Gecko Register {self._register}"
         valueAccessType = f"[{self.value:08X}]" if (
@@ -3316,10 +2051,6 @@ class GeckoRegisterOperateI(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_REG_OPERATE_I
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -3334,14 +2065,17 @@ class GeckoRegisterOperateI(GeckoCommand):
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (int(self._opType) << 20) | (
             self._flags << 16) | self._register
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class GeckoRegisterOperate(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_REG_OPERATE
+    __slots__ = ("_opType", "_register", "_other", "_flags", "_value")
+
     def __init__(self, otherRegister: int, opType: GeckoCommand.ArithmeticType, flags: int = 0, register: int = 0):
         GeckoCommand.assert_register(register)
         GeckoCommand.assert_register(otherRegister)
@@ -3352,7 +2086,7 @@ class GeckoRegisterOperate(GeckoCommand):
         self._flags = flags
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         grAccessType = f"[Gecko Register {self._register}]" if (
             self._flags & 1) != 0 else f"Gecko Register {self._register}"
         valueAccessType = f"[Gecko Register {self._other}]" if (
@@ -3399,10 +2133,6 @@ class GeckoRegisterOperate(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_REG_OPERATE
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -3417,14 +2147,17 @@ class GeckoRegisterOperate(GeckoCommand):
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (int(self._opType) << 20) | (
             self._flags << 16) | self._register
         info = self._other
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class MemoryCopyTo(GeckoCommand):
+    codetype = GeckoCommand.Type.MEMCPY_1
+    __slots__ = ("_value", "_size", "_register", "_other", "_isPointer")
+
     def __init__(self, value: int, size: int, otherRegister: int = 0xF,
                  register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
@@ -3437,7 +2170,7 @@ class MemoryCopyTo(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
 
@@ -3465,10 +2198,6 @@ class MemoryCopyTo(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.MEMCPY_1
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -3489,15 +2218,18 @@ class MemoryCopyTo(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._size << 8) | (
             self._register << 4) | self._other
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class MemoryCopyFrom(GeckoCommand):
+    codetype = GeckoCommand.Type.MEMCPY_2
+    __slots__ = ("_value", "_size", "_register", "_other", "_isPointer")
+
     def __init__(self, value: int, size: int, otherRegister: int = 0xF,
                  register: int = 0, isPointer: bool = False):
         GeckoCommand.assert_register(register)
@@ -3510,7 +2242,7 @@ class MemoryCopyFrom(GeckoCommand):
         self._isPointer = isPointer
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
 
@@ -3538,10 +2270,6 @@ class MemoryCopyFrom(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.MEMCPY_2
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -3562,15 +2290,18 @@ class MemoryCopyFrom(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._size << 8) | (
             self._register << 4) | self._other
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class GeckoIfEqual16(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_IF_EQ_16
+    __slots__ = ("_mask", "_address", "_endif", "_register", "_other", "_isPointer", "_children")
+
     def __init__(self, address: int = 0, register: int = 0, otherRegister: int = 15,
                  isPointer: bool = False, endif: bool = False, mask: int = 0xFFFF):
         GeckoCommand.assert_register(register)
@@ -3585,24 +2316,32 @@ class GeckoIfEqual16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         home = f"(Gecko Register {self._register} & ~0x{self._mask:04X})" if self._register != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         target = f"(Gecko Register {self._other} & ~0x{self._mask:04X})" if self._other != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If {home} is equal to {target}:{childrenPrint}"
+        return f"({intType:02X}) {endif}If {home} is equal to {target}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -3618,10 +2357,6 @@ class GeckoIfEqual16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_IF_EQ_16
-
     def add_child(self, child: "GeckoCommand", index: int = -1):
         if index < 0:
             self._children.append(child)
@@ -3644,26 +2379,22 @@ class GeckoIfEqual16(GeckoCommand):
         return 1 if self._endif else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFE) | (1 if self._endif else 0)
         info = (self._other << 28) | (self._register << 24) | self._mask
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class GeckoIfNotEqual16(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_IF_NEQ_16
+    __slots__ = ("_mask", "_address", "_endif", "_register", "_other", "_isPointer", "_children")
+
     def __init__(self, address: int = 0, register: int = 0, otherRegister: int = 15,
                  isPointer: bool = False, endif: bool = False, mask: int = 0xFFFF):
         GeckoCommand.assert_register(register)
@@ -3678,24 +2409,32 @@ class GeckoIfNotEqual16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         home = f"(Gecko Register {self._register} & ~0x{self._mask:04X})" if self._register != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         target = f"(Gecko Register {self._other} & ~0x{self._mask:04X})" if self._other != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If {home} is not equal to {target}:{childrenPrint}"
+        return f"({intType:02X}) {endif}If {home} is not equal to {target}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -3711,10 +2450,6 @@ class GeckoIfNotEqual16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_IF_NEQ_16
-
     def add_child(self, child: "GeckoCommand", index: int = -1):
         if index < 0:
             self._children.append(child)
@@ -3737,26 +2472,22 @@ class GeckoIfNotEqual16(GeckoCommand):
         return 1 if self._endif else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFE) | (1 if self._endif else 0)
         info = (self._other << 28) | (self._register << 24) | self._mask
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class GeckoIfGreaterThan16(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_IF_GT_16
+    __slots__ = ("_mask", "_address", "_endif", "_register", "_other", "_isPointer", "_children")
+
     def __init__(self, address: int = 0, register: int = 0, otherRegister: int = 15,
                  isPointer: bool = False, endif: bool = False, mask: int = 0xFFFF):
         GeckoCommand.assert_register(register)
@@ -3771,24 +2502,32 @@ class GeckoIfGreaterThan16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         home = f"(Gecko Register {self._register} & ~0x{self._mask:04X})" if self._register != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         target = f"(Gecko Register {self._other} & ~0x{self._mask:04X})" if self._other != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If {home} is greater than {target}:{childrenPrint}"
+        return f"({intType:02X}) {endif}If {home} is greater than {target}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -3804,10 +2543,6 @@ class GeckoIfGreaterThan16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_IF_GT_16
-
     def add_child(self, child: "GeckoCommand", index: int = -1):
         if index < 0:
             self._children.append(child)
@@ -3830,26 +2565,22 @@ class GeckoIfGreaterThan16(GeckoCommand):
         return 1 if self._endif else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFE) | (1 if self._endif else 0)
         info = (self._other << 28) | (self._register << 24) | self._mask
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class GeckoIfLesserThan16(GeckoCommand):
+    codetype = GeckoCommand.Type.GECKO_IF_LT_16
+    __slots__ = ("_mask", "_address", "_endif", "_register", "_other", "_isPointer", "_children")
+
     def __init__(self, address: int = 0, register: int = 0, otherRegister: int = 15,
                  isPointer: bool = False, endif: bool = False, mask: int = 0xFFFF):
         GeckoCommand.assert_register(register)
@@ -3864,24 +2595,32 @@ class GeckoIfLesserThan16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         home = f"(Gecko Register {self._register} & ~0x{self._mask:04X})" if self._register != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         target = f"(Gecko Register {self._other} & ~0x{self._mask:04X})" if self._other != 0xF else f"the short at address (0x{self._address:08X} + the {addrstr})"
         endif = "(Apply Endif) " if self._endif else ""
-        return f"({intType:02X}) {endif}If {home} is less than {target}:{childrenPrint}"
+        return f"({intType:02X}) {endif}If {home} is less than {target}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -3897,10 +2636,6 @@ class GeckoIfLesserThan16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.GECKO_IF_LT_16
-
     def add_child(self, child: "GeckoCommand", index: int = -1):
         if index < 0:
             self._children.append(child)
@@ -3923,26 +2658,22 @@ class GeckoIfLesserThan16(GeckoCommand):
         return 1 if self._endif else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFE) | (1 if self._endif else 0)
         info = (self._other << 28) | (self._register << 24) | self._mask
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class CounterIfEqual16(GeckoCommand):
+    codetype = GeckoCommand.Type.COUNTER_IF_EQ_16
+    __slots__ = ("_value", "_mask", "_flags", "_counter", "_children")
+
     def __init__(self, value: int, mask: int = 0xFFFF,
                  flags: int = 0, counter: int = 0):
         self.value = value
@@ -3952,22 +2683,30 @@ class CounterIfEqual16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype)
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = int(self.codetype)
         ty = "(Resets counter if true) " if (self._flags &
                                              0x8) != 0 else "(Resets counter if false) "
         endif = "(Apply Endif) " if (self._flags & 0x1) != 0 else ""
-        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is equal to {self._counter}:{childrenPrint}"
+        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is equal to {self._counter}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -3983,10 +2722,6 @@ class CounterIfEqual16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.COUNTER_IF_EQ_16
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFF
@@ -4013,24 +2748,20 @@ class CounterIfEqual16(GeckoCommand):
         return 1 if (self._flags & 0x1) != 0 else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._counter << 4) | self._flags
         info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class CounterIfNotEqual16(GeckoCommand):
+    codetype = GeckoCommand.Type.COUNTER_IF_NEQ_16
+    __slots__ = ("_value", "_mask", "_flags", "_counter", "_children")
+
     def __init__(self, value: int, mask: int = 0xFFFF,
                  flags: int = 0, counter: int = 0):
         self.value = value
@@ -4040,22 +2771,30 @@ class CounterIfNotEqual16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype)
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = int(self.codetype)
         ty = "(Resets counter if true) " if (self._flags &
                                              0x8) != 0 else "(Resets counter if false) "
         endif = "(Apply Endif) " if (self._flags & 0x1) != 0 else ""
-        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is not equal to {self._counter}:{childrenPrint}"
+        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is not equal to {self._counter}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -4071,10 +2810,6 @@ class CounterIfNotEqual16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.COUNTER_IF_NEQ_16
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFF
@@ -4101,24 +2836,20 @@ class CounterIfNotEqual16(GeckoCommand):
         return 1 if (self._flags & 0x1) != 0 else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._counter << 4) | self._flags
         info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class CounterIfGreaterThan16(GeckoCommand):
+    codetype = GeckoCommand.Type.COUNTER_IF_GT_16
+    __slots__ = ("_value", "_mask", "_flags", "_counter", "_children")
+
     def __init__(self, value: int, mask: int = 0xFFFF,
                  flags: int = 0, counter: int = 0):
         self.value = value
@@ -4128,22 +2859,30 @@ class CounterIfGreaterThan16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype)
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = int(self.codetype)
         ty = "(Resets counter if true) " if (self._flags &
                                              0x8) != 0 else "(Resets counter if false) "
         endif = "(Apply Endif) " if (self._flags & 0x1) != 0 else ""
-        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is greater than {self._counter}:{childrenPrint}"
+        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is greater than {self._counter}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -4159,10 +2898,6 @@ class CounterIfGreaterThan16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.COUNTER_IF_GT_16
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFF
@@ -4189,24 +2924,20 @@ class CounterIfGreaterThan16(GeckoCommand):
         return 1 if (self._flags & 0x1) != 0 else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._counter << 4) | self._flags
         info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class CounterIfLesserThan16(GeckoCommand):
+    codetype = GeckoCommand.Type.COUNTER_IF_LT_16
+    __slots__ = ("_value", "_mask", "_flags", "_counter", "_children")
+
     def __init__(self, value: int, mask: int = 0xFFFF,
                  flags: int = 0, counter: int = 0):
         self.value = value
@@ -4216,22 +2947,30 @@ class CounterIfLesserThan16(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + sum([len(c) for c in self])
+        return 8 + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype)
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = int(self.codetype)
         ty = "(Resets counter if true) " if (self._flags &
                                              0x8) != 0 else "(Resets counter if false) "
         endif = "(Apply Endif) " if (self._flags & 0x1) != 0 else ""
-        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is less than {self._counter}:{childrenPrint}"
+        return f"({intType:02X}) {endif}{ty}If (0x{self.value:08X} & ~0x{self._mask:04X}) is less than {self._counter}:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -4247,10 +2986,6 @@ class CounterIfLesserThan16(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.COUNTER_IF_LT_16
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFF
@@ -4277,24 +3012,20 @@ class CounterIfLesserThan16(GeckoCommand):
         return 1 if (self._flags & 0x1) != 0 else 0
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._counter << 4) | self._flags
         info = (self._mask << 16) | self.value
-        body = b""
-        for code in self:
-            body += code.as_bytes()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + body
+        body = b"".join([code.as_bytes() for code in self._children])
+        return _pack_header(metadata, info) + body
 
 
 class AsmExecute(GeckoCommand):
+    codetype = GeckoCommand.Type.ASM_EXECUTE
+    __slots__ = ("_value",)
+
     def __init__(self, value: bytes):
         self.value = value
 
@@ -4302,7 +3033,7 @@ class AsmExecute(GeckoCommand):
         return 8 + len(self.value)
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         return f"({intType:02X}) Execute the designated ASM once every pass"
 
     def __getitem__(self, index: int) -> bytes:
@@ -4314,10 +3045,6 @@ class AsmExecute(GeckoCommand):
                 f"Cannot assign {value.__class__.__name__} to the data of {self.__class__.__name__}")
         self.value[index] = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.ASM_EXECUTE
-
     @property
     def value(self) -> bytes:
         return self._value
@@ -4330,13 +3057,16 @@ class AsmExecute(GeckoCommand):
         return ((len(self) + 7) & -0x8) >> 3
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = intType << 24
         info = self.virtual_length() - 1
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + _align_bytes(self.value, alignment=8)
+        return _pack_header(metadata, info) + _align_bytes(self.value, alignment=8)
 
 
 class AsmInsert(GeckoCommand):
+    codetype = GeckoCommand.Type.ASM_INSERT
+    __slots__ = ("_value", "_address", "_isPointer", "_isLink")
+
     def __init__(self, value: bytes, address: int = 0, isPointer: bool = False, isLink: bool = False):
         self.value = value
         self._address = address & 0x1FFFFFF
@@ -4347,7 +3077,7 @@ class AsmInsert(GeckoCommand):
         return 8 + len(self.value)
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         btype = "(bl / NaN)" if self._isLink else "(b / b)"
@@ -4362,10 +3092,6 @@ class AsmInsert(GeckoCommand):
                 f"Cannot assign {value.__class__.__name__} to the data of {self.__class__.__name__}")
         self.value[index] = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.ASM_INSERT
-
     @property
     def value(self) -> bytes:
         length = len(self._value)
@@ -4387,15 +3113,18 @@ class AsmInsert(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFC) | (1 if self._isLink else 0)
         info = self.virtual_length() - 1
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + _align_bytes(self.value, alignment=8)
+        return _pack_header(metadata, info) + _align_bytes(self.value, alignment=8)
 
 
 class AsmInsertLink(GeckoCommand):
+    codetype = GeckoCommand.Type.ASM_INSERT_LINK
+    __slots__ = ("_value", "_address", "_isPointer")
+
     def __init__(self, value: bytes, address: int = 0, isPointer: bool = False):
         self.value = value
         self._address = address & 0x1FFFFFF
@@ -4405,7 +3134,7 @@ class AsmInsertLink(GeckoCommand):
         return 8 + len(self.value)
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         btype = "(bl / NaN)"
@@ -4420,10 +3149,6 @@ class AsmInsertLink(GeckoCommand):
                 f"Cannot assign {value.__class__.__name__} to the data of {self.__class__.__name__}")
         self.value[index] = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.ASM_INSERT_LINK
-
     @property
     def value(self) -> bytes:
         length = len(self._value)
@@ -4445,15 +3170,18 @@ class AsmInsertLink(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFC)
         info = self.virtual_length() - 1
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + _align_bytes(self.value, alignment=8)
+        return _pack_header(metadata, info) + _align_bytes(self.value, alignment=8)
 
 
 class WriteBranch(GeckoCommand):
+    codetype = GeckoCommand.Type.WRITE_BRANCH
+    __slots__ = ("_value", "_address", "_isPointer", "_isLink")
+
     def __init__(self, value: Union[int, bytes], address: int = 0, isPointer: bool = False, isLink: bool = False):
         self.value = value
         self._address = address & 0x1FFFFFC
@@ -4464,7 +3192,7 @@ class WriteBranch(GeckoCommand):
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         linking = "linking " if self._isLink else ""
@@ -4486,10 +3214,6 @@ class WriteBranch(GeckoCommand):
 
         self.value = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.WRITE_BRANCH
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -4518,15 +3242,18 @@ class WriteBranch(GeckoCommand):
         return False
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFC) | (1 if self._isLink else 0)
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Switch(GeckoCommand):
+    codetype = GeckoCommand.Type.SWITCH
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -4534,13 +3261,9 @@ class Switch(GeckoCommand):
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         return f"({intType:02X}) Toggle the code execution status when reached (True <-> False)"
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.SWITCH
-
     def virtual_length(self) -> int:
         return 1
 
@@ -4549,6 +3272,9 @@ class Switch(GeckoCommand):
 
 
 class AddressRangeCheck(GeckoCommand):
+    codetype = GeckoCommand.Type.ADDR_RANGE_CHECK
+    __slots__ = ("_value", "_isPointer", "_endif")
+
     def __init__(self, value: int, isPointer: bool = False, endif: bool = False):
         self.value = value
         self._isPointer = isPointer
@@ -4558,7 +3284,7 @@ class AddressRangeCheck(GeckoCommand):
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         endif = "(Apply Endif) " if self._endif else ""
@@ -4583,10 +3309,6 @@ class AddressRangeCheck(GeckoCommand):
         v |= (value & 0xFFFF) << (16 * (index ^ 1))
         self.value = v
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.ADDR_RANGE_CHECK
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -4610,14 +3332,17 @@ class AddressRangeCheck(GeckoCommand):
         return 1 if self._endif != 0 else 0
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) | (
+        intType = self.codetype | (
             0x10 if self._isPointer else 0)
         metadata = (intType << 24) | self._endif
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Terminator(GeckoCommand):
+    codetype = GeckoCommand.Type.TERMINATOR
+    __slots__ = ("_value",)
+
     def __init__(self, value: int):
         self.value = value
 
@@ -4625,7 +3350,7 @@ class Terminator(GeckoCommand):
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         baStr = f" Set the base address to {self[0]:08X}." if self[0] != 0 else ""
         poStr = f" Set the pointer address to {self[1]:08X}." if self[1] != 0 else ""
         return f"({intType:02X}) Clear the code execution status.{baStr}{poStr}"
@@ -4649,10 +3374,6 @@ class Terminator(GeckoCommand):
         v |= (value & 0xFFFF) << (16 * (index ^ 1))
         self.value = v
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.TERMINATOR
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -4670,13 +3391,16 @@ class Terminator(GeckoCommand):
         return 1
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = intType << 24
         info = self.value
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Endif(GeckoCommand):
+    codetype = GeckoCommand.Type.ENDIF
+    __slots__ = ("_value", "_asElse", "_endifNum")
+
     def __init__(self, value: int, asElse: bool = False, numEndifs: int = 0):
         self.value = value
         self._asElse = asElse
@@ -4686,7 +3410,7 @@ class Endif(GeckoCommand):
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         baStr = f" Set the base address to 0x{self[0]:08X}." if self[0] != 0 else ""
         poStr = f" Set the pointer address to 0x{self[1]:08X}." if self[1] != 0 else ""
         elseStr = "Inverse the code execution status (else) " if self._asElse else ""
@@ -4712,10 +3436,6 @@ class Endif(GeckoCommand):
         v |= (value & 0xFFFF) << (16 * (index ^ 1))
         self.value = v
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.ENDIF
-
     @property
     def value(self) -> int:
         return self._value & 0xFFFFFFFF
@@ -4733,13 +3453,16 @@ class Endif(GeckoCommand):
         return self._endifNum
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (self._asElse << 20) | self._endifNum
         info = self.virtual_length()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False)
+        return _pack_header(metadata, info)
 
 
 class Exit(GeckoCommand):
+    codetype = GeckoCommand.Type.EXIT
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -4747,13 +3470,9 @@ class Exit(GeckoCommand):
         return 8
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         return f"({intType:02X}) Flag the end of the codelist, the codehandler exits"
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.EXIT
-
     def virtual_length(self) -> int:
         return 1
 
@@ -4762,6 +3481,9 @@ class Exit(GeckoCommand):
 
 
 class AsmInsertXOR(GeckoCommand):
+    codetype = GeckoCommand.Type.ASM_INSERT_XOR
+    __slots__ = ("_value", "_mask", "_xorCount", "_address", "_isPointer", "_isLink")
+
     def __init__(self, value: bytes, address: int = 0, isPointer: bool = False, mask: int = 0, xorCount: int = 0, isLink: bool = False):
         self.value = value
         self._mask = mask
@@ -4774,7 +3496,7 @@ class AsmInsertXOR(GeckoCommand):
         return 8 + len(self.value)
 
     def __str__(self) -> str:
-        intType = GeckoCommand.type_to_int(self.codetype) + (
+        intType = self.codetype + (
             2 if self._isPointer else 0)
         addrstr = "pointer address" if self._isPointer else "base address"
         btype = "(bl / NaN)" if self._isLink else "(b / b)"
@@ -4789,10 +3511,6 @@ class AsmInsertXOR(GeckoCommand):
                 f"Cannot assign {value.__class__.__name__} to the data of {self.__class__.__name__}")
         self.value[index] = value
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.ASM_INSERT_XOR
-
     @property
     def value(self) -> bytes:
         length = len(self._value)
@@ -4814,16 +3532,19 @@ class AsmInsertXOR(GeckoCommand):
         return self._isPointer
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype) + (
+        intType = self.codetype + (
             2 if self._isPointer else 0)
         metadata = (intType << 24) | (self._address &
                                       0x1FFFFFC) | (1 if self._isLink else 0)
         info = (self._xorCount << 24) | (
-            self._mask << 8) | self.virtual_length()
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + _align_bytes(self.value, alignment=8)
+            self._mask << 8) | (self.virtual_length() - 1)
+        return _pack_header(metadata, info) + _align_bytes(self.value, alignment=8)
 
 
 class BrainslugSearch(GeckoCommand):
+    codetype = GeckoCommand.Type.BRAINSLUG_SEARCH
+    __slots__ = ("_value", "_address", "_searchRange", "_children")
+
     def __init__(self, value: Union[int, bytes], address: int = 0, searchRange: Tuple[int, int] = [0x8000, 0x8180]):
         self.value = value
         self._address = address & 0x1FFFFFF
@@ -4831,19 +3552,27 @@ class BrainslugSearch(GeckoCommand):
         self._children = []
 
     def __len__(self) -> int:
-        return 8 + len(self.value) + sum([len(c) for c in self])
+        return 8 + len(self.value) + sum(len(c) for c in self._children)
 
     def __str__(self) -> str:
-        if len(self.children) > 0:
+        if len(self._children) > 0:
             GeckoCommand._IndentionStart += GeckoCommand._IndentionWidth
-            childrenPrint = "\n" + "\n".join([" "*GeckoCommand._IndentionStart + str(child)
-                                              for child in self._children])
-            GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
+            try:
+                indent = " " * GeckoCommand._IndentionStart
+                childrenPrint = "\n" + "\n".join([indent + str(child) for child in self._children])
+            finally:
+                GeckoCommand._IndentionStart -= GeckoCommand._IndentionWidth
         else:
             childrenPrint = ""
 
-        intType = GeckoCommand.type_to_int(self.codetype)
-        return f"({intType:02X}) If the linear data search finds a match between addresses 0x{(self._searchRange[0] & 0xFFFF) << 16:08X} and 0x{(self._searchRange[1] & 0xFFFF) << 16:08X}, set the pointer address to the beginning of the match and run:{childrenPrint}"
+        return self._header_str() + childrenPrint
+
+    def _header_str(self) -> str:
+        intType = int(self.codetype)
+        return f"({intType:02X}) If the linear data search finds a match between addresses 0x{(self._searchRange[0] & 0xFFFF) << 16:08X} and 0x{(self._searchRange[1] & 0xFFFF) << 16:08X}, set the pointer address to the beginning of the match and run:"
+
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._children)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._children[index]
@@ -4859,10 +3588,6 @@ class BrainslugSearch(GeckoCommand):
     def children(self) -> List["GeckoCommand"]:
         return self._children
 
-    @classproperty
-    def codetype(cls) -> GeckoCommand.Type:
-        return GeckoCommand.Type.BRAINSLUG_SEARCH
-
     @property
     def value(self) -> bytes:
         return self._value
@@ -4884,18 +3609,13 @@ class BrainslugSearch(GeckoCommand):
         return len(self.children) + 1
 
     def populate_from_bytes(self, f: BytesIO) -> "GeckoCommand":
-        while f.tell() < _get_io_length(f):
-            code = GeckoCommand.bytes_to_geckocommand(f)
-            if code.get_endifs() <= 0:
-                self.add_child(code)
-            else:
-                return code
+        return _bytes_populate_till_endif(self, f)
 
     def as_bytes(self) -> bytes:
-        intType = GeckoCommand.type_to_int(self.codetype)
+        intType = int(self.codetype)
         metadata = (intType << 24) | (((len(self.value) + 7) & -0x8) >> 3)
         info = (self._searchRange[0] << 16) | self._searchRange[1]
-        return metadata.to_bytes(4, "big", signed=False) + info.to_bytes(4, "big", signed=False) + _align_bytes(self.value, alignment=8)
+        return _pack_header(metadata, info) + _align_bytes(self.value, alignment=8)
 
 
 class GeckoCode(object):
@@ -4946,7 +3666,7 @@ class GeckoCode(object):
             self._commands = commands
 
     def __len__(self) -> int:
-        return sum([len(command) for command in self._commands])
+        return sum(len(command) for command in self._commands)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.__dict__})"
@@ -4957,16 +3677,8 @@ class GeckoCode(object):
         author = f" [{self.author.strip()}]" if self.author else ""
         return f"{self.name.strip()}{author}{desc}"
 
-    def __iter__(self):
-        self._iterpos = 0
-        return self
-
-    def __next__(self) -> GeckoCommand:
-        try:
-            self._iterpos += 1
-            return self[self._iterpos-1]
-        except IndexError:
-            raise StopIteration
+    def __iter__(self) -> Iterator[GeckoCommand]:
+        return iter(self._commands)
 
     def __getitem__(self, index: int) -> GeckoCommand:
         return self._commands[index]
@@ -4978,14 +3690,16 @@ class GeckoCode(object):
 
         self._commands[index] = value
 
-    def __hash__(self) -> str:
-        return sum([ord(c) for c in str(self)]) + sum([hash(command) for command in self._commands])
+    def __hash__(self) -> int:
+        return hash(self._key())
 
     def __eq__(self, other: "GeckoCode") -> bool:
-        return hash(self) == hash(other)
+        if not isinstance(other, GeckoCode):
+            return NotImplemented
+        return self._key() == other._key()
 
     def __ne__(self, other: "GeckoCode") -> bool:
-        return hash(self) != hash(other)
+        return not self == other
 
     def __add__(self, other: GeckoCommand) -> "GeckoCode":
         if not isinstance(other, GeckoCommand):
@@ -5013,8 +3727,12 @@ class GeckoCode(object):
 
     @classmethod
     def from_bytes(cls, f: Union[BinaryIO, bytes], name: Optional[str] = None, author: Optional[str] = None, desc: Optional[str] = None, enabled: bool = True, preapplicable: bool = True) -> "GeckoCode":
-        if not isinstance(f, BufferedIOBase):
-            f = BytesIO(f)
+        if isinstance(f, (bytes, bytearray, memoryview)):
+            buf = f
+            start = None
+        else:
+            start = f.tell()
+            buf = f.read()
 
         code = cls(f"GeckoCode {GeckoCode._TmpNameCounter}" if name is None else name,
                    author,
@@ -5023,12 +3741,18 @@ class GeckoCode(object):
                    preapplicable=preapplicable)
         GeckoCode._TmpNameCounter += 1
 
-        while f.tell() < _get_io_length(f):
-            command = GeckoCommand.bytes_to_geckocommand(f)
+        offset = 0
+        length = len(buf)
+        while offset < length:
+            command, offset = _bytes_to_command(buf, offset)
+            if command is None:
+                raise InvalidGeckoCodeError("Data passed to bytes parser did not resolve to a command!")
             if command.codetype == GeckoCommand.Type.EXIT:
                 break
             code.add_child(command)
 
+        if start is not None:
+            f.seek(start + offset)
         return code
 
     @classmethod
@@ -5043,11 +3767,14 @@ class GeckoCode(object):
                    preapplicable=preapplicable)
         GeckoCode._TmpNameCounter += 1
 
-        while f.tell() < _get_io_length(f):
+        length = _get_io_length(f)
+        while f.tell() < length:
             command = GeckoCommand.str_to_geckocommand(f)
-            code.add_child(command)
+            if command is None:
+                raise InvalidGeckoCodeError("Data passed to text parser did not resolve to a command!")
             if command.codetype == GeckoCommand.Type.EXIT:
                 break
+            code.add_child(command)
 
         return code
 
@@ -5081,11 +3808,11 @@ class GeckoCode(object):
 
     def is_equal_body(self, other: "GeckoCode") -> bool:
         """Return if the commands in this GeckoCode are the same as the other"""
-        return sum([hash(command) for command in self._commands]) == sum([hash(command) for command in other])
+        return sum(hash(command) for command in self._commands) == sum(hash(command) for command in other)
 
     def virtual_length(self) -> int:
         """Return the length of this GeckoCode in Gecko \"lines\""""
-        return sum([command.virtual_length() for command in self._commands])
+        return sum(command.virtual_length() for command in self._commands)
 
     def apply(self, dol: DolFile) -> bool:
         """Apply this GeckoCode directly to a DOL if supported as provided by a `DolFile`
@@ -5096,7 +3823,8 @@ class GeckoCode(object):
 
         status = False
         for command in self._commands:
-            status |= command.apply(dol)
+            if command.apply(dol):
+                status = True
         return status
 
     def apply_f(self, dolpath: str) -> bool:
@@ -5115,16 +3843,677 @@ class GeckoCode(object):
 
         return True
 
+    def _key(self) -> Tuple[str, str, str, bool, bytes]:
+        return (self.name, self.author, self.desc, self._enabled, self.as_bytes())
+
     def as_bytes(self) -> bytes:
         """Return this GeckoCode as its raw form"""
-        data = b""
-        for command in self._commands:
-            data += command.as_bytes()
-        return data
+        return b"".join(command.as_bytes() for command in self._commands)
 
     def as_text(self) -> str:
         """Return this GeckoCode as its textual form (As generally found in documentation)"""
-        data = ""
-        for command in self._commands:
-            data += f"{command.as_text()}\n"
-        return data.rstrip()
+        return "\n".join(command.as_text() for command in self._commands).rstrip()
+
+
+def _expand_opcode_table(parsers: Dict[GeckoCommand.Type, Callable]) -> Tuple[Optional[Callable], ...]:
+    return tuple(None if codetype is None else parsers[codetype] for codetype in _TypeFromOpcode)
+
+
+def _bytes_to_command(buf: bytes, offset: int) -> Tuple[Optional[GeckoCommand], int]:
+    line = buf[offset:offset + 8]
+    if len(line) < 4:
+        return None, offset
+
+    metadata = int.from_bytes(line[:4], "big", signed=False)
+    info = int.from_bytes(line[4:], "big", signed=False)
+
+    parser = _BytesOpcodeParsers[metadata >> 24]
+    if parser is None:
+        f = BytesIO(buf[offset:])
+        return GeckoCommand._BadCommandBytesCB(f), offset + f.tell()
+
+    address = metadata & 0x1FFFFFF
+    isPointerType = ((metadata >> 24) & 0x10 != 0)
+
+    return parser(buf, offset + len(line), metadata, info, address, isPointerType)
+
+
+def _bytes_read(buf: bytes, offset: int, size: int) -> Tuple[bytes, int]:
+    data = bytes(buf[offset:offset + size])
+    return data, offset + len(data)
+
+
+def _bytes_add_children_till_terminator(code: GeckoCommand, buf: bytes, offset: int) -> int:
+    length = len(buf)
+    while offset < length:
+        if _TypeFromOpcode[buf[offset] & 0xFE] in _BlockEndTypes:
+            return offset
+        child, offset = _bytes_to_command(buf, offset)
+        if child is None:
+            raise InvalidGeckoCommandError("Data passed to bytes parser did not resolve to a command!")
+        code.add_child(child)
+    return offset
+
+
+def _bytes_add_children_till_endif(code: GeckoCommand, buf: bytes, offset: int) -> Tuple[Optional[GeckoCommand], int]:
+    length = len(buf)
+    while offset < length:
+        child, offset = _bytes_to_command(buf, offset)
+        if child is None:
+            raise InvalidGeckoCommandError("Data passed to bytes parser did not resolve to a command!")
+        if child.get_endifs() <= 0:
+            code.add_child(child)
+        else:
+            return child, offset
+    return None, offset
+
+
+def _bytes_populate_till_endif(code: GeckoCommand, f: BinaryIO) -> Optional[GeckoCommand]:
+    if isinstance(f, BytesIO):
+        with f.getbuffer() as buf:
+            endCode, offset = _bytes_add_children_till_endif(code, buf, f.tell())
+        f.seek(offset)
+        return endCode
+
+    buf = _StreamBuffer(f)
+    endCode, offset = _bytes_add_children_till_endif(code, buf, 0)
+    f.seek(buf.start + offset)
+    return endCode
+
+
+def _str_add_children_till_terminator(code: GeckoCommand, f: TextIO):
+    length = _get_io_length(f)
+    while f.tell() < length:
+        child = GeckoCommand.str_to_geckocommand(f)
+        if child is None:
+            raise InvalidGeckoCommandError("Data passed to text parser did not resolve to a command!")
+        if child.codetype in _BlockEndTypes:
+            f.seek(f.tell() - 17)
+            return
+        code.add_child(child)
+
+
+def _bytes_to_write_8(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info & 0xFF
+    repeat = info >> 16
+    return Write8._from_fields(value, address, repeat, isPointerType), offset
+
+
+def _bytes_to_write_16(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info & 0xFFFF
+    repeat = info >> 16
+    return Write16._from_fields(value, address, repeat, isPointerType), offset
+
+
+def _bytes_to_write_32(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    return Write32._from_fields(info, address, isPointerType), offset
+
+
+def _bytes_to_write_str(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    size = info
+    data, offset = _bytes_read(buf, offset, size)
+    return WriteString(data, address, isPointerType), offset + ((size + 7) & -8) - size
+
+
+def _bytes_to_write_serial(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    serial, offset = _bytes_read(buf, offset, 8)
+    valueSize = int.from_bytes(serial[:1], "big", signed=False) >> 4
+    repeat = int.from_bytes(serial[:2], "big", signed=False) & 0xFFF
+    addressInc = int.from_bytes(serial[2:4], "big", signed=False)
+    valueInc = int.from_bytes(serial[4:], "big", signed=False)
+    return WriteSerial(value, address, repeat, isPointerType, valueSize, addressInc, valueInc), offset
+
+
+def _bytes_to_repeat_set(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info & 0xF
+    repeat = metadata & 0xFFFF
+    return SetRepeat(repeat, value), offset
+
+
+def _bytes_to_repeat_exec(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info & 0xF
+    return ExecuteRepeat(value), offset
+
+
+def _bytes_to_return(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info & 0xF
+    return Return(value), offset
+
+
+def _bytes_to_goto(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = metadata & 0xFFFF
+    flags = (metadata & 0x00300000) >> 20
+    return Goto(flags, value), offset
+
+
+def _bytes_to_gosub(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = metadata & 0xFFFF
+    flags = (metadata & 0x00300000) >> 20
+    register = info & 0xF
+    return Gosub(flags, value, register), offset
+
+
+def _bytes_to_gecko_reg_set(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    flags = (metadata & 0x00110000) >> 16
+    register = metadata & 0xF
+    return GeckoRegisterSet(value, flags, register, isPointerType), offset
+
+
+def _bytes_to_gecko_reg_load(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    flags = (metadata & 0x00310000) >> 16
+    register = metadata & 0xF
+    return GeckoRegisterLoad(value, flags, register, isPointerType), offset
+
+
+def _bytes_to_gecko_reg_store(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    flags = (metadata & 0x00310000) >> 16
+    register = metadata & 0xF
+    repeat = (metadata & 0xFFF0) >> 4
+    return GeckoRegisterStore(value, repeat, flags, register, isPointerType), offset
+
+
+def _bytes_to_gecko_reg_operate_i(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    flags = (metadata & 0x00030000) >> 16
+    register = metadata & 0xF
+    opType = GeckoCommand.ArithmeticType(
+        (metadata & 0x00F00000) >> 18)
+    return GeckoRegisterOperateI(value, opType, flags, register), offset
+
+
+def _bytes_to_gecko_reg_operate(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info & 0xF
+    flags = (metadata & 0x00030000) >> 16
+    register = metadata & 0xF
+    opType = GeckoCommand.ArithmeticType(
+        (metadata & 0x00F00000) >> 18)
+    return GeckoRegisterOperate(value, opType, flags, register), offset
+
+
+def _bytes_to_memcpy_1(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    size = (metadata & 0x00FFFF00) >> 8
+    register = (metadata & 0xF0) >> 4
+    otherRegister = metadata & 0xF
+    return MemoryCopyTo(value, size, otherRegister, register, isPointerType), offset
+
+
+def _bytes_to_memcpy_2(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    size = (metadata & 0x00FFFF00) >> 8
+    register = (metadata & 0xF0) >> 4
+    otherRegister = metadata & 0xF
+    return MemoryCopyFrom(value, size, otherRegister, register, isPointerType), offset
+
+
+def _bytes_to_asm_execute(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    data, offset = _bytes_read(buf, offset, info << 3)
+    return AsmExecute(data), offset
+
+
+def _bytes_to_asm_insert(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    data, offset = _bytes_read(buf, offset, info << 3)
+    return AsmInsert(data, address, isPointerType, isLink=(address & 1) != 0), offset
+
+
+def _bytes_to_asm_insert_link(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    data, offset = _bytes_read(buf, offset, info << 3)
+    return AsmInsert(data, address, isPointerType), offset
+
+
+def _bytes_to_write_branch(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    dest = info
+    return WriteBranch(dest, address, isPointerType, isLink=(address & 1) != 0), offset
+
+
+def _bytes_to_switch(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    return Switch(), offset
+
+
+def _bytes_to_addr_range_check(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    endif = metadata & 0x1
+    return AddressRangeCheck(value, isPointerType, endif), offset
+
+
+def _bytes_to_terminator(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    return Terminator(value), offset
+
+
+def _bytes_to_endif(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    inverse = (metadata & 0x00F00000) >> 24
+    numEndifs = metadata & 0xFF
+    return Endif(value, inverse, numEndifs), offset
+
+
+def _bytes_to_exit(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    return Exit(), offset
+
+
+def _bytes_to_asm_insert_xor(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    size = info & 0x000000FF
+    xor = (info & 0x00FFFF00) >> 8
+    num = (info & 0xFF000000) >> 24
+    pointer = (metadata >> 24) & 0xFE == 0xF4
+    data, offset = _bytes_read(buf, offset, size << 3)
+    return AsmInsertXOR(data, address, pointer, xor, num, isLink=(address & 1) != 0), offset
+
+
+def _bytes_to_brainslug_search(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+    value = info
+    size = metadata & 0x000000FF
+    data, offset = _bytes_read(buf, offset, size << 3)
+    _code = BrainslugSearch(data, address, [
+                            (value & 0xFFFF0000) >> 16, value & 0xFFFF])
+    offset = _bytes_add_children_till_terminator(_code, buf, offset)
+    return _code, offset
+
+
+def _bytes_if32_parser(cls: type) -> Callable[[bytes, int, int, int, int, bool], Tuple[GeckoCommand, int]]:
+    def parser(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+        _code = cls(info, address, endif=(address & 1) == 1)
+        offset = _bytes_add_children_till_terminator(_code, buf, offset)
+        return _code, offset
+    return parser
+
+
+def _bytes_if16_parser(cls: type) -> Callable[[bytes, int, int, int, int, bool], Tuple[GeckoCommand, int]]:
+    def parser(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+        _code = cls(info & 0xFFFF, address, endif=(address & 1) == 1, mask=info >> 16)
+        offset = _bytes_add_children_till_terminator(_code, buf, offset)
+        return _code, offset
+    return parser
+
+
+def _bytes_address_parser(cls: type, flagMask: int) -> Callable[[bytes, int, int, int, int, bool], Tuple[GeckoCommand, int]]:
+    def parser(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+        return cls(info, metadata & flagMask, metadata & 0xF, isPointerType), offset
+    return parser
+
+
+def _bytes_get_next_parser(cls: type) -> Callable[[bytes, int, int, int, int, bool], Tuple[GeckoCommand, int]]:
+    def parser(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+        return cls(info), offset
+    return parser
+
+
+def _bytes_gecko_if_parser(cls: type) -> Callable[[bytes, int, int, int, int, bool], Tuple[GeckoCommand, int]]:
+    def parser(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+        register = (info & 0x0F000000) >> 24
+        otherRegister = (info & 0xF0000000) >> 28
+        mask = info & 0xFFFF
+        _code = cls(address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
+        offset = _bytes_add_children_till_terminator(_code, buf, offset)
+        return _code, offset
+    return parser
+
+
+def _bytes_counter_if_parser(cls: type) -> Callable[[bytes, int, int, int, int, bool], Tuple[GeckoCommand, int]]:
+    def parser(buf: bytes, offset: int, metadata: int, info: int, address: int, isPointerType: bool) -> Tuple[GeckoCommand, int]:
+        counter = (metadata & 0xFFFF0) >> 4
+        flags = metadata & 9
+        mask = (info & 0xFFFF0000) >> 16
+        value = info & 0xFFFF
+        _code = cls(value, mask, flags, counter)
+        offset = _bytes_add_children_till_terminator(_code, buf, offset)
+        return _code, offset
+    return parser
+
+
+_BytesCommandParsers: Dict[GeckoCommand.Type, Callable[[bytes, int, int, int, int, bool], Tuple[GeckoCommand, int]]] = {
+    GeckoCommand.Type.WRITE_8: _bytes_to_write_8,
+    GeckoCommand.Type.WRITE_16: _bytes_to_write_16,
+    GeckoCommand.Type.WRITE_32: _bytes_to_write_32,
+    GeckoCommand.Type.WRITE_STR: _bytes_to_write_str,
+    GeckoCommand.Type.WRITE_SERIAL: _bytes_to_write_serial,
+    GeckoCommand.Type.IF_EQ_32: _bytes_if32_parser(IfEqual32),
+    GeckoCommand.Type.IF_NEQ_32: _bytes_if32_parser(IfNotEqual32),
+    GeckoCommand.Type.IF_GT_32: _bytes_if32_parser(IfGreaterThan32),
+    GeckoCommand.Type.IF_LT_32: _bytes_if32_parser(IfLesserThan32),
+    GeckoCommand.Type.IF_EQ_16: _bytes_if16_parser(IfEqual16),
+    GeckoCommand.Type.IF_NEQ_16: _bytes_if16_parser(IfNotEqual16),
+    GeckoCommand.Type.IF_GT_16: _bytes_if16_parser(IfGreaterThan16),
+    GeckoCommand.Type.IF_LT_16: _bytes_if16_parser(IfLesserThan16),
+    GeckoCommand.Type.BASE_ADDR_LOAD: _bytes_address_parser(BaseAddressLoad, 0x01110000),
+    GeckoCommand.Type.BASE_ADDR_SET: _bytes_address_parser(BaseAddressSet, 0x01110000),
+    GeckoCommand.Type.BASE_ADDR_STORE: _bytes_address_parser(BaseAddressStore, 0x00110000),
+    GeckoCommand.Type.BASE_GET_NEXT: _bytes_get_next_parser(BaseAddressGetNext),
+    GeckoCommand.Type.PTR_ADDR_LOAD: _bytes_address_parser(PointerAddressLoad, 0x01110000),
+    GeckoCommand.Type.PTR_ADDR_SET: _bytes_address_parser(PointerAddressSet, 0x01110000),
+    GeckoCommand.Type.PTR_ADDR_STORE: _bytes_address_parser(PointerAddressStore, 0x00110000),
+    GeckoCommand.Type.PTR_GET_NEXT: _bytes_get_next_parser(PointerAddressGetNext),
+    GeckoCommand.Type.REPEAT_SET: _bytes_to_repeat_set,
+    GeckoCommand.Type.REPEAT_EXEC: _bytes_to_repeat_exec,
+    GeckoCommand.Type.RETURN: _bytes_to_return,
+    GeckoCommand.Type.GOTO: _bytes_to_goto,
+    GeckoCommand.Type.GOSUB: _bytes_to_gosub,
+    GeckoCommand.Type.GECKO_REG_SET: _bytes_to_gecko_reg_set,
+    GeckoCommand.Type.GECKO_REG_LOAD: _bytes_to_gecko_reg_load,
+    GeckoCommand.Type.GECKO_REG_STORE: _bytes_to_gecko_reg_store,
+    GeckoCommand.Type.GECKO_REG_OPERATE_I: _bytes_to_gecko_reg_operate_i,
+    GeckoCommand.Type.GECKO_REG_OPERATE: _bytes_to_gecko_reg_operate,
+    GeckoCommand.Type.MEMCPY_1: _bytes_to_memcpy_1,
+    GeckoCommand.Type.MEMCPY_2: _bytes_to_memcpy_2,
+    GeckoCommand.Type.GECKO_IF_EQ_16: _bytes_gecko_if_parser(GeckoIfEqual16),
+    GeckoCommand.Type.GECKO_IF_NEQ_16: _bytes_gecko_if_parser(GeckoIfNotEqual16),
+    GeckoCommand.Type.GECKO_IF_GT_16: _bytes_gecko_if_parser(GeckoIfGreaterThan16),
+    GeckoCommand.Type.GECKO_IF_LT_16: _bytes_gecko_if_parser(GeckoIfLesserThan16),
+    GeckoCommand.Type.COUNTER_IF_EQ_16: _bytes_counter_if_parser(CounterIfEqual16),
+    GeckoCommand.Type.COUNTER_IF_NEQ_16: _bytes_counter_if_parser(CounterIfNotEqual16),
+    GeckoCommand.Type.COUNTER_IF_GT_16: _bytes_counter_if_parser(CounterIfGreaterThan16),
+    GeckoCommand.Type.COUNTER_IF_LT_16: _bytes_counter_if_parser(CounterIfLesserThan16),
+    GeckoCommand.Type.ASM_EXECUTE: _bytes_to_asm_execute,
+    GeckoCommand.Type.ASM_INSERT: _bytes_to_asm_insert,
+    GeckoCommand.Type.ASM_INSERT_LINK: _bytes_to_asm_insert_link,
+    GeckoCommand.Type.WRITE_BRANCH: _bytes_to_write_branch,
+    GeckoCommand.Type.SWITCH: _bytes_to_switch,
+    GeckoCommand.Type.ADDR_RANGE_CHECK: _bytes_to_addr_range_check,
+    GeckoCommand.Type.TERMINATOR: _bytes_to_terminator,
+    GeckoCommand.Type.ENDIF: _bytes_to_endif,
+    GeckoCommand.Type.EXIT: _bytes_to_exit,
+    GeckoCommand.Type.ASM_INSERT_XOR: _bytes_to_asm_insert_xor,
+    GeckoCommand.Type.BRAINSLUG_SEARCH: _bytes_to_brainslug_search,
+}
+
+_BytesOpcodeParsers = _expand_opcode_table(_BytesCommandParsers)
+
+
+def _str_to_write_8(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info & 0xFF
+    repeat = info >> 16
+    return Write8(value, address, repeat, isPointerType)
+
+
+def _str_to_write_16(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info & 0xFFFF
+    repeat = info >> 16
+    return Write16(value, address, repeat, isPointerType)
+
+
+def _str_to_write_32(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    return Write32(value, address, isPointerType)
+
+
+def _str_to_write_str(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    size = info
+    data = bytes.fromhex("".join(islice(f, ((size + 7) & -8) >> 3)))
+    return WriteString(data[:size], address, isPointerType)
+
+
+def _str_to_write_serial(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    serial = bytes.fromhex(f.readline())
+    value = info
+    valueSize = int.from_bytes(serial[:1], "big", signed=False) >> 4
+    repeat = int.from_bytes(serial[:2], "big", signed=False) & 0xFFF
+    addressInc = int.from_bytes(serial[2:4], "big", signed=False)
+    valueInc = int.from_bytes(serial[4:8], "big", signed=False)
+    return WriteSerial(value, address, repeat, isPointerType, valueSize, addressInc, valueInc)
+
+
+def _str_to_repeat_set(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info & 0xF
+    repeat = metadata & 0xFFFF
+    return SetRepeat(repeat, value)
+
+
+def _str_to_repeat_exec(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info & 0xF
+    return ExecuteRepeat(value)
+
+
+def _str_to_return(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info & 0xF
+    return Return(value)
+
+
+def _str_to_goto(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = metadata & 0xFFFF
+    flags = (metadata & 0x00300000) >> 20
+    return Goto(flags, value)
+
+
+def _str_to_gosub(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = metadata & 0xFFFF
+    flags = (metadata & 0x00300000) >> 20
+    register = info & 0xF
+    return Gosub(flags, value, register)
+
+
+def _str_to_gecko_reg_set(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    flags = (metadata & 0x00110000) >> 16
+    register = metadata & 0xF
+    return GeckoRegisterSet(value, flags, register, isPointerType)
+
+
+def _str_to_gecko_reg_load(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    flags = (metadata & 0x00310000) >> 16
+    register = metadata & 0xF
+    return GeckoRegisterLoad(value, flags, register, isPointerType)
+
+
+def _str_to_gecko_reg_store(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    flags = (metadata & 0x00310000) >> 16
+    register = metadata & 0xF
+    repeat = (metadata & 0xFFF0) >> 4
+    return GeckoRegisterStore(value, repeat, flags, register, isPointerType)
+
+
+def _str_to_gecko_reg_operate_i(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    flags = (metadata & 0x00030000) >> 16
+    register = metadata & 0xF
+    opType = GeckoCommand.ArithmeticType(
+        (metadata & 0x00F00000) >> 18)
+    return GeckoRegisterOperateI(value, opType, flags, register)
+
+
+def _str_to_gecko_reg_operate(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info & 0xF
+    flags = (metadata & 0x00030000) >> 16
+    register = metadata & 0xF
+    opType = GeckoCommand.ArithmeticType(
+        (metadata & 0x00F00000) >> 18)
+    return GeckoRegisterOperate(value, opType, flags, register)
+
+
+def _str_to_memcpy_1(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    size = (metadata & 0x00FFFF00) >> 8
+    register = (metadata & 0xF0) >> 4
+    otherRegister = metadata & 0xF
+    return MemoryCopyTo(value, size, otherRegister, register, isPointerType)
+
+
+def _str_to_memcpy_2(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    size = (metadata & 0x00FFFF00) >> 8
+    register = (metadata & 0xF0) >> 4
+    otherRegister = metadata & 0xF
+    return MemoryCopyFrom(value, size, otherRegister, register, isPointerType)
+
+
+def _str_to_asm_execute(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    size = info
+    data = bytes.fromhex("".join(islice(f, size)))
+    return AsmExecute(data)
+
+
+def _str_to_asm_insert(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    size = info
+    data = bytes.fromhex("".join(islice(f, size)))
+    return AsmInsert(data, address, isPointerType, isLink=(address & 1) != 0)
+
+
+def _str_to_asm_insert_link(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    size = info
+    data = bytes.fromhex("".join(islice(f, size)))
+    return AsmInsertLink(data, address, isPointerType)
+
+
+def _str_to_write_branch(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    dest = info
+    return WriteBranch(dest, address, isPointerType, isLink=(address & 1) != 0)
+
+
+def _str_to_switch(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    return Switch()
+
+
+def _str_to_addr_range_check(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    endif = metadata & 0x1
+    return AddressRangeCheck(value, isPointerType, endif)
+
+
+def _str_to_terminator(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    return Terminator(value)
+
+
+def _str_to_endif(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    inverse = (metadata & 0x00F00000) >> 24
+    numEndifs = metadata & 0xFF
+    return Endif(value, inverse, numEndifs)
+
+
+def _str_to_exit(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    return Exit()
+
+
+def _str_to_asm_insert_xor(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    size = info & 0x000000FF
+    xor = (info & 0x00FFFF00) >> 8
+    num = (info & 0xFF000000) >> 24
+    pointer = (metadata >> 24) & 0xFE == 0xF4
+    data = bytes.fromhex("".join(islice(f, size)))
+    return AsmInsertXOR(data, address, pointer, xor, num, isLink=(address & 1) != 0)
+
+
+def _str_to_brainslug_search(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+    value = info
+    size = metadata & 0x000000FF
+    data = bytes.fromhex("".join(islice(f, size)))
+    _code = BrainslugSearch(data, address, [
+                            (value & 0xFFFF0000) >> 16, value & 0xFFFF])
+    _str_add_children_till_terminator(_code, f)
+    return _code
+
+
+def _str_if32_parser(cls: type) -> Callable[[TextIO, int, int, int, bool], GeckoCommand]:
+    def parser(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+        _code = cls(info, address, endif=(address & 1) == 1)
+        _str_add_children_till_terminator(_code, f)
+        return _code
+    return parser
+
+
+def _str_if16_parser(cls: type) -> Callable[[TextIO, int, int, int, bool], GeckoCommand]:
+    def parser(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+        _code = cls(info & 0xFFFF, address, endif=(address & 1) == 1, mask=info >> 16)
+        _str_add_children_till_terminator(_code, f)
+        return _code
+    return parser
+
+
+def _str_address_parser(cls: type, flagMask: int) -> Callable[[TextIO, int, int, int, bool], GeckoCommand]:
+    def parser(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+        return cls(info, metadata & flagMask, metadata & 0xF, isPointerType)
+    return parser
+
+
+def _str_get_next_parser(cls: type) -> Callable[[TextIO, int, int, int, bool], GeckoCommand]:
+    def parser(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+        return cls(info)
+    return parser
+
+
+def _str_gecko_if_parser(cls: type) -> Callable[[TextIO, int, int, int, bool], GeckoCommand]:
+    def parser(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+        register = (info & 0x0F000000) >> 24
+        otherRegister = (info & 0xF0000000) >> 28
+        mask = info & 0xFFFF
+        _code = cls(address, register, otherRegister, isPointerType, (address & 1) == 1, mask)
+        _str_add_children_till_terminator(_code, f)
+        return _code
+    return parser
+
+
+def _str_counter_if_parser(cls: type) -> Callable[[TextIO, int, int, int, bool], GeckoCommand]:
+    def parser(f: TextIO, metadata: int, info: int, address: int, isPointerType: bool) -> GeckoCommand:
+        counter = (metadata & 0xFFFF0) >> 4
+        flags = metadata & 9
+        mask = (info & 0xFFFF0000) >> 16
+        value = info & 0xFFFF
+        _code = cls(value, mask, flags, counter)
+        _str_add_children_till_terminator(_code, f)
+        return _code
+    return parser
+
+
+_StrCommandParsers: Dict[GeckoCommand.Type, Callable[[TextIO, int, int, int, bool], GeckoCommand]] = {
+    GeckoCommand.Type.WRITE_8: _str_to_write_8,
+    GeckoCommand.Type.WRITE_16: _str_to_write_16,
+    GeckoCommand.Type.WRITE_32: _str_to_write_32,
+    GeckoCommand.Type.WRITE_STR: _str_to_write_str,
+    GeckoCommand.Type.WRITE_SERIAL: _str_to_write_serial,
+    GeckoCommand.Type.IF_EQ_32: _str_if32_parser(IfEqual32),
+    GeckoCommand.Type.IF_NEQ_32: _str_if32_parser(IfNotEqual32),
+    GeckoCommand.Type.IF_GT_32: _str_if32_parser(IfGreaterThan32),
+    GeckoCommand.Type.IF_LT_32: _str_if32_parser(IfLesserThan32),
+    GeckoCommand.Type.IF_EQ_16: _str_if16_parser(IfEqual16),
+    GeckoCommand.Type.IF_NEQ_16: _str_if16_parser(IfNotEqual16),
+    GeckoCommand.Type.IF_GT_16: _str_if16_parser(IfGreaterThan16),
+    GeckoCommand.Type.IF_LT_16: _str_if16_parser(IfLesserThan16),
+    GeckoCommand.Type.BASE_ADDR_LOAD: _str_address_parser(BaseAddressLoad, 0x01110000),
+    GeckoCommand.Type.BASE_ADDR_SET: _str_address_parser(BaseAddressSet, 0x01110000),
+    GeckoCommand.Type.BASE_ADDR_STORE: _str_address_parser(BaseAddressStore, 0x00110000),
+    GeckoCommand.Type.BASE_GET_NEXT: _str_get_next_parser(BaseAddressGetNext),
+    GeckoCommand.Type.PTR_ADDR_LOAD: _str_address_parser(PointerAddressLoad, 0x01110000),
+    GeckoCommand.Type.PTR_ADDR_SET: _str_address_parser(PointerAddressSet, 0x01110000),
+    GeckoCommand.Type.PTR_ADDR_STORE: _str_address_parser(PointerAddressStore, 0x00110000),
+    GeckoCommand.Type.PTR_GET_NEXT: _str_get_next_parser(PointerAddressGetNext),
+    GeckoCommand.Type.REPEAT_SET: _str_to_repeat_set,
+    GeckoCommand.Type.REPEAT_EXEC: _str_to_repeat_exec,
+    GeckoCommand.Type.RETURN: _str_to_return,
+    GeckoCommand.Type.GOTO: _str_to_goto,
+    GeckoCommand.Type.GOSUB: _str_to_gosub,
+    GeckoCommand.Type.GECKO_REG_SET: _str_to_gecko_reg_set,
+    GeckoCommand.Type.GECKO_REG_LOAD: _str_to_gecko_reg_load,
+    GeckoCommand.Type.GECKO_REG_STORE: _str_to_gecko_reg_store,
+    GeckoCommand.Type.GECKO_REG_OPERATE_I: _str_to_gecko_reg_operate_i,
+    GeckoCommand.Type.GECKO_REG_OPERATE: _str_to_gecko_reg_operate,
+    GeckoCommand.Type.MEMCPY_1: _str_to_memcpy_1,
+    GeckoCommand.Type.MEMCPY_2: _str_to_memcpy_2,
+    GeckoCommand.Type.GECKO_IF_EQ_16: _str_gecko_if_parser(GeckoIfEqual16),
+    GeckoCommand.Type.GECKO_IF_NEQ_16: _str_gecko_if_parser(GeckoIfNotEqual16),
+    GeckoCommand.Type.GECKO_IF_GT_16: _str_gecko_if_parser(GeckoIfGreaterThan16),
+    GeckoCommand.Type.GECKO_IF_LT_16: _str_gecko_if_parser(GeckoIfLesserThan16),
+    GeckoCommand.Type.COUNTER_IF_EQ_16: _str_counter_if_parser(CounterIfEqual16),
+    GeckoCommand.Type.COUNTER_IF_NEQ_16: _str_counter_if_parser(CounterIfNotEqual16),
+    GeckoCommand.Type.COUNTER_IF_GT_16: _str_counter_if_parser(CounterIfGreaterThan16),
+    GeckoCommand.Type.COUNTER_IF_LT_16: _str_counter_if_parser(CounterIfLesserThan16),
+    GeckoCommand.Type.ASM_EXECUTE: _str_to_asm_execute,
+    GeckoCommand.Type.ASM_INSERT: _str_to_asm_insert,
+    GeckoCommand.Type.ASM_INSERT_LINK: _str_to_asm_insert_link,
+    GeckoCommand.Type.WRITE_BRANCH: _str_to_write_branch,
+    GeckoCommand.Type.SWITCH: _str_to_switch,
+    GeckoCommand.Type.ADDR_RANGE_CHECK: _str_to_addr_range_check,
+    GeckoCommand.Type.TERMINATOR: _str_to_terminator,
+    GeckoCommand.Type.ENDIF: _str_to_endif,
+    GeckoCommand.Type.EXIT: _str_to_exit,
+    GeckoCommand.Type.ASM_INSERT_XOR: _str_to_asm_insert_xor,
+    GeckoCommand.Type.BRAINSLUG_SEARCH: _str_to_brainslug_search,
+}
+
+_StrOpcodeParsers = _expand_opcode_table(_StrCommandParsers)
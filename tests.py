@@ -4,16 +4,21 @@ import time
 
 from io import StringIO
 from geckolibs.gct import GeckoCodeTable, GeckoTextType
+from geckolibs.geckocode import GeckoCode, InvalidGeckoCodeError, Write32
 
 VERBOSE = False
 
-def assert_output_equality(_type: GeckoTextType, inFile: Path, outFile: Path, asMap: bool = False, lengthRestricted: bool = False):
+def load_gct(inFile: Path) -> GeckoCodeTable:
     if inFile.suffix.lower() == ".gct":
         with inFile.open("rb") as f:
-            _gct = GeckoCodeTable.from_bytes(f)
+            return GeckoCodeTable.from_bytes(f)
     else:
         with inFile.open("r") as f:
-            _gct = GeckoCodeTable.from_text(f)
+            return GeckoCodeTable.from_text(f)
+
+
+def assert_output_equality(_type: GeckoTextType, inFile: Path, outFile: Path, asMap: bool = False, lengthRestricted: bool = False):
+    _gct = load_gct(inFile)
     test = outFile.read_text().strip()
     if asMap:
         buf = StringIO()
@@ -31,9 +36,66 @@ def assert_output_equality(_type: GeckoTextType, inFile: Path, outFile: Path, as
         print(f"Test case {inFile.name} succeeded")
 
 
+def assert_bytes_equality(inFile: Path, outFile: Path):
+    _gct = load_gct(inFile)
+    if _gct.as_bytes() != outFile.read_bytes():
+        print(f"Test case {inFile.name} -> {outFile.name} failed")
+    else:
+        print(f"Test case {inFile.name} -> {outFile.name} succeeded")
+
+
+def assert_parse_error(inFile: Path, error: type):
+    try:
+        load_gct(inFile)
+    except error:
+        print(f"Test case {inFile.name} succeeded")
+    except Exception:
+        print(f"Test case {inFile.name} failed")
+    else:
+        print(f"Test case {inFile.name} failed")
+
+
+def assert_iadd_identity(inFile: Path):
+    _gct = load_gct(inFile)
+    original = _gct
+    data = _gct.as_bytes()
+    _gct += GeckoCodeTable()
+    if _gct is not original or _gct.as_bytes() != data:
+        print(f"Test case {inFile.name} += GeckoCodeTable() failed")
+    else:
+        print(f"Test case {inFile.name} += GeckoCodeTable() succeeded")
+
+
+def assert_reordered_inequality(name: str, commands: list):
+    first = GeckoCodeTable()
+    first.add_child(GeckoCode(name, None, None, list(commands)))
+    copy = GeckoCodeTable()
+    copy.add_child(GeckoCode(name, None, None, list(commands)))
+    second = GeckoCodeTable()
+    second.add_child(GeckoCode(name, None, None, list(reversed(commands))))
+    if first != copy or hash(first) != hash(copy):
+        print(f"Test case {name} reordered failed")
+    elif first == second or len({first, second}) != 2:
+        print(f"Test case {name} reordered failed")
+    else:
+        print(f"Test case {name} reordered succeeded")
+
 
 
 assert_output_equality(GeckoTextType.OCARINA, Path("tests/ocarina.txt"), Path("tests/ocarina.txt"))
 assert_output_equality(GeckoTextType.DOLPHIN, Path("tests/dolphin.txt"), Path("tests/dolphin.txt"), lengthRestricted=True)
 assert_output_equality(GeckoTextType.RAW, Path("tests/raw.txt"), Path("tests/raw.txt"))
-assert_output_equality(GeckoTextType.RAW, Path("tests/print_map.gct"), Path("tests/print_map_output.txt"), asMap=True)
\ No newline at end of file
+assert_output_equality(GeckoTextType.RAW, Path("tests/print_map.gct"), Path("tests/print_map_output.txt"), asMap=True)
+assert_output_equality(GeckoTextType.RAW, Path("tests/dumps/exit.txt"), Path("tests/dumps/exit_output.txt"))
+assert_bytes_equality(Path("tests/dumps/exit.txt"), Path("tests/dumps/exit.gct"))
+assert_bytes_equality(Path("tests/dumps/exit.gct"), Path("tests/dumps/exit.gct"))
+
+assert_iadd_identity(Path("tests/dumps/exit.txt"))
+assert_parse_error(Path("tests/dumps/truncated.gct"), InvalidGeckoCodeError)
+assert_output_equality(GeckoTextType.RAW, Path("tests/dumps/asm_insert_xor.txt"), Path("tests/dumps/asm_insert_xor.txt"))
+assert_bytes_equality(Path("tests/dumps/asm_insert_xor.txt"), Path("tests/dumps/asm_insert_xor.gct"))
+assert_bytes_equality(Path("tests/dumps/asm_insert_xor.gct"), Path("tests/dumps/asm_insert_xor.gct"))
+assert_output_equality(GeckoTextType.RAW, Path("tests/dumps/switch.txt"), Path("tests/dumps/switch.txt"))
+assert_bytes_equality(Path("tests/dumps/switch.txt"), Path("tests/dumps/switch.gct"))
+assert_bytes_equality(Path("tests/dumps/switch.gct"), Path("tests/dumps/switch.gct"))
+assert_reordered_inequality("x", [Write32(1, 0x100), Write32(2, 0x200)])